@@ -0,0 +1,51 @@
+"""Micro-benchmark of the discrete Coons patch from compas against the NumPy kernel across patch sizes,
+and of the densification of the example coarse quad mesh.
+
+"""
+from __future__ import print_function
+
+import os
+import time
+from math import pi
+from math import sin
+
+from compas.geometry import discrete_coons_patch
+
+from compas_singular.datastructures import CoarseQuadMesh
+from compas_singular.geometry import discrete_coons_patch_numpy
+
+HERE = os.path.dirname(__file__)
+FILE = os.path.join(HERE, '../examples/data/coarse_quad_mesh_british_museum.json')
+
+
+def boundaries(n, m):
+    ab = [[float(i) / (n - 1), 0.1 * sin(pi * i / (n - 1)), 0.] for i in range(n)]
+    dc = [[float(i) / (n - 1), 1., 0.2 * sin(pi * i / (n - 1))] for i in range(n)]
+    ad = [[0., float(j) / (m - 1), 0.] for j in range(m)]
+    bc = [[1., float(j) / (m - 1), 0.1 * sin(pi * j / (m - 1))] for j in range(m)]
+    return ab, bc, dc, ad
+
+
+def timing(func, repeat):
+    t0 = time.time()
+    for _ in range(repeat):
+        func()
+    return (time.time() - t0) / repeat
+
+
+if __name__ == '__main__':
+
+    print('{:>10}{:>14}{:>14}{:>10}'.format('size', 'compas (ms)', 'numpy (ms)', 'speedup'))
+    for n in [2, 4, 8, 16, 32, 64, 128]:
+        ab, bc, dc, ad = boundaries(n, n)
+        repeat = max(1, 2000 // (n * n))
+        t_compas = timing(lambda: discrete_coons_patch(ab, bc, dc, ad), repeat)
+        t_numpy = timing(lambda: discrete_coons_patch_numpy(ab, bc, dc, ad), repeat)
+        print('{:>10}{:>14.3f}{:>14.3f}{:>10.1f}'.format('{}x{}'.format(n, n), 1e3 * t_compas, 1e3 * t_numpy, t_compas / t_numpy))
+
+    mesh = CoarseQuadMesh.from_json(FILE)
+    mesh.collect_strips()
+    for density in [2, 4, 8, 16]:
+        mesh.set_strips_density(density)
+        t = timing(mesh.densification, 1)
+        print('densification at density {:>3}: {:>8.3f} s, {} faces'.format(density, t, mesh.get_quad_mesh().number_of_faces()))
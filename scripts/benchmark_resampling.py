@@ -0,0 +1,68 @@
+"""Benchmark of the adaptive boundary resampling before the skeleton decomposition.
+
+The example decomposition input is decomposed as is, densified uniformly, and resampled from both,
+without and with the topology check against the decomposition of the input.
+For each input, the number of boundary and feature points, the time of the triangulation and decomposition,
+and the topology of the resulting coarse quad mesh are printed.
+
+"""
+from __future__ import print_function
+
+import os
+import json
+import time
+
+from compas.geometry import add_vectors
+from compas.geometry import delaunay_from_points_numpy
+from compas.geometry import scale_vector
+from compas.geometry import subtract_vectors
+
+from compas_singular.algorithms import boundary_resampling_numpy
+from compas_singular.algorithms import boundary_triangulation
+from compas_singular.algorithms import SkeletonDecomposition
+
+HERE = os.path.dirname(__file__)
+FILE = os.path.join(HERE, '../examples/data/01_decomposition.json')
+
+
+def densify(polyline, n, closed):
+    points = polyline + polyline[:1] if closed else polyline
+    dense = [add_vectors(u, scale_vector(subtract_vectors(v, u), k / n)) for u, v in zip(points[:-1], points[1:]) for k in range(n)]
+    return dense if closed else dense + points[-1:]
+
+
+def decompose(data):
+    outer_boundary, inner_boundaries, polyline_features, point_features = data
+    t0 = time.time()
+    trimesh = boundary_triangulation(outer_boundary, inner_boundaries, polyline_features, point_features, delaunay=delaunay_from_points_numpy)
+    decomposition = SkeletonDecomposition.from_mesh(trimesh)
+    coarsemesh = decomposition.decomposition_mesh(point_features)
+    t1 = time.time()
+    valencies = sorted(coarsemesh.vertex_degree(vkey) for vkey in coarsemesh.vertices() if not coarsemesh.is_vertex_on_boundary(vkey))
+    return t1 - t0, len(decomposition.singular_faces()), coarsemesh.number_of_faces(), valencies
+
+
+def report(name, data):
+    points = sum(len(polyline) for polyline in [data[0]] + data[1] + data[2])
+    seconds, singularities, faces, valencies = decompose(data)
+    print('{:<24} {:>6} points {:>8.3f} s {:>4} singularities {:>4} coarse faces, interior valencies {}'.format(name, points, seconds, singularities, faces, valencies))
+
+
+if __name__ == '__main__':
+
+    with open(FILE, 'r') as f:
+        data = json.load(f)
+
+    outer_boundary, inner_boundaries, polyline_features, point_features = data
+    dense = [
+        densify(outer_boundary, 4, True),
+        [densify(inner_boundary, 4, True) for inner_boundary in inner_boundaries],
+        [densify(polyline, 4, False) for polyline in polyline_features],
+        point_features]
+
+    report('input', data)
+    report('input resampled', list(boundary_resampling_numpy(*data)))
+    report('input preserved', list(boundary_resampling_numpy(*data, preserve_topology=True, delaunay=delaunay_from_points_numpy)))
+    report('dense', dense)
+    report('dense resampled', list(boundary_resampling_numpy(*dense)))
+    report('dense preserved', list(boundary_resampling_numpy(*dense, preserve_topology=True, delaunay=delaunay_from_points_numpy)))
@@ -28,9 +28,13 @@ Algorithm for decomposition of surfaces into coarse quad meshes. Optional point
     :nosignatures:
 
     surface_discrete_mapping
+    boundary_resampling_numpy
     boundary_triangulation
+    constrained_delaunay_triangle
     Skeleton
     SkeletonDecomposition
+    DecompositionPipeline
+    batch_decomposition
     DecompositionRemap
 
 
@@ -57,9 +61,15 @@ if not compas.IPY:
 from .layout import *  # noqa: F401 F403
 from .propagation import *  # noqa: F401 F403
 from .triangulation import *  # noqa: F401 F403
+
+if not compas.IPY:
+    from .resampling_numpy import *  # noqa: F401 F403
+
 from .twocoloring import *  # noqa: F401 F403
 
 from .decomposition import *  # noqa: F401 F403
+from .pipeline import *  # noqa: F401 F403
+from .batch import *  # noqa: F401 F403
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -0,0 +1,167 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import os
+import json
+import traceback
+
+from .pipeline import DecompositionPipeline
+
+
+__all__ = ['batch_decomposition']
+
+
+def batch_decomposition(filepaths, folder, processes=None, **parameters):
+    """Decompose many inputs into dense quad meshes, optionally in a process pool.
+
+    Each input is a JSON file with the outer boundary, the inner boundaries, the polyline features and the point features,
+    as the example decomposition data. The coarse and dense quad meshes of each input are written to the output folder
+    as soon as the input is done, as ``<index>_<name>_coarse.json`` and ``<index>_<name>_dense.json`` with the position of the input,
+    and one summary line per input is appended to ``summary.jsonl`` in the output folder. A failing input is reported in its summary line without stopping the others.
+    If a process terminates abruptly, the inputs that were not done are run again one at a time in their own process
+    to report the ones that crash.
+
+    Parameters
+    ----------
+    filepaths : iterable
+        The paths of the input JSON files.
+    folder : str
+        The output folder.
+    processes : int, optional
+        The number of processes. Default is to run in this process.
+    parameters
+        Parameters of the ``DecompositionPipeline``, such as the target length. Functions must be importable to run in a process pool.
+
+    Returns
+    -------
+    list
+        The summaries per input, in the order of the input paths, as dictionaries with the input position and path,
+        whether it succeeded, the error traceback, the output paths, the numbers of coarse and dense faces and the stage timings.
+
+    """
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+
+    tasks = [(index, filepath, folder, parameters) for index, filepath in enumerate(filepaths)]
+    summaries = [None] * len(tasks)
+
+    with open(os.path.join(folder, 'summary.jsonl'), 'a') as f:
+
+        def done(summary):
+            f.write(json.dumps(summary) + '\n')
+            f.flush()
+            summaries[summary['index']] = summary
+
+        if processes:
+            pending = pool_decomposition(tasks, processes, done)
+            for task in pending:
+                if pool_decomposition([task], 1, done):
+                    summary = job_summary(task[0], task[1])
+                    summary['error'] = 'The process decomposing the input terminated abruptly.'
+                    done(summary)
+        else:
+            for task in tasks:
+                done(decomposition_job(task))
+
+    return summaries
+
+
+def pool_decomposition(tasks, processes, done):
+    """Run decomposition jobs in a process pool, calling back on each summary as soon as it is done.
+
+    Parameters
+    ----------
+    tasks : list
+        The job arguments.
+    processes : int
+        The number of processes.
+    done : callable
+        The function called on each summary.
+
+    Returns
+    -------
+    list
+        The tasks that were not done because a process terminated abruptly.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import as_completed
+    from concurrent.futures.process import BrokenProcessPool
+
+    called = set()
+    with ProcessPoolExecutor(processes) as executor:
+        futures = {executor.submit(decomposition_job, task): task for task in tasks}
+        try:
+            for future in as_completed(futures):
+                done(future.result())
+                called.add(future)
+        except BrokenProcessPool:
+            pass
+
+    pending = []
+    for future, task in futures.items():
+        if future in called:
+            continue
+        if future.done() and future.exception() is None:
+            done(future.result())
+        else:
+            pending.append(task)
+    return pending
+
+
+def job_summary(index, filepath):
+    """Summary of an input before its decomposition.
+    """
+    return {'index': index, 'input': filepath, 'success': False, 'error': None, 'coarse': None, 'dense': None,
+            'coarse_faces': None, 'dense_faces': None, 'timings': {}}
+
+
+def decomposition_job(args):
+    """Decompose one input and write its coarse and dense quad meshes, catching any error.
+
+    Parameters
+    ----------
+    args : tuple
+        The input position, the input path, the output folder and the pipeline parameters.
+
+    Returns
+    -------
+    dict
+        The summary of the input.
+
+    """
+    index, filepath, folder, parameters = args
+    name = '{}_{}'.format(index, os.path.splitext(os.path.basename(filepath))[0])
+    summary = job_summary(index, filepath)
+
+    try:
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+
+        pipeline = DecompositionPipeline(*data)
+        pipeline.parameters.update(parameters)
+        densemesh = pipeline.run()
+        coarsemesh = pipeline.result('strips')
+        summary['timings'] = pipeline.timings
+
+        summary['coarse'] = os.path.join(folder, name + '_coarse.json')
+        summary['dense'] = os.path.join(folder, name + '_dense.json')
+        coarsemesh.to_json(summary['coarse'])
+        densemesh.to_json(summary['dense'])
+        summary['coarse_faces'] = coarsemesh.number_of_faces()
+        summary['dense_faces'] = densemesh.number_of_faces()
+        summary['success'] = True
+
+    except Exception:
+        summary['error'] = traceback.format_exc()
+
+    return summary
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
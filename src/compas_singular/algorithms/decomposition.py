@@ -6,6 +6,9 @@ from math import floor
 # from math import ceil
 from math import pi
 from operator import itemgetter
+from itertools import product
+
+import compas
 
 from compas.geometry import Polyline
 # from compas.geometry import length_vector
@@ -15,9 +18,7 @@ from compas.geometry import angle_vectors
 from compas.geometry import angle_vectors_signed
 # from compas.geometry import cross_vectors
 from compas.geometry import centroid_points
-from compas.datastructures import trimesh_face_circle
-from compas.datastructures import network_polylines
-from compas.datastructures import mesh_insert_vertex_on_edge
+from compas.geometry import distance_point_point
 from compas.datastructures import mesh_substitute_vertex_in_faces
 from compas.datastructures import mesh_explode
 from compas.datastructures import mesh_weld
@@ -27,13 +28,15 @@ from compas.utilities import window
 from compas.utilities import geometric_key
 
 from ..datastructures import CoarsePseudoQuadMesh
-from ..datastructures import Network
 from ..datastructures import Skeleton
 from ..datastructures import split_quad_in_pseudo_quads
 from ..utilities import list_split
 
 from .propagation import quadrangulate_mesh
 
+if not compas.IPY:
+    from ..geometry import polygons_turning_angles_numpy
+
 
 __all__ = ['SkeletonDecomposition']
 
@@ -47,6 +50,7 @@ class SkeletonDecomposition(Skeleton):
         super(SkeletonDecomposition, self).__init__()
         self.mesh = None
         self.polylines = None
+        self.extremities_to_polyline = {}
         self.relative_kink_angle_limit = pi / 8.
         self.flip_angle_limit = pi / 2.
 
@@ -111,6 +115,47 @@ class SkeletonDecomposition(Skeleton):
         """
         return [vkey for fkey in self.singular_faces() for vkey in self.face_vertices(fkey)]
 
+    def boundary_turning_angles(self, boundaries=None):
+        """Return the turning angles, relative kinks and curvatures at the boundary vertices, computed for all the boundaries at once.
+
+        Parameters
+        ----------
+        boundaries : list, optional
+            The boundaries as lists of vertex keys. Default is the mesh boundaries.
+
+        Returns
+        -------
+        angles : dict
+            The turning angles in rad between the incoming and the outgoing boundary edges per vertex.
+        kinks : dict
+            The turning angles relative to the mean turning angle of the two adjacent boundary vertices per vertex.
+        curvatures : dict
+            The turning angles divided by the mean length of the two adjacent boundary edges per vertex.
+
+        """
+
+        if boundaries is None:
+            boundaries = self.vertices_on_boundaries()
+        vkeys = [vkey for bdry in boundaries for vkey in bdry]
+
+        if not compas.IPY:
+            polygons = [[self.vertex_coordinates(vkey) for vkey in bdry] for bdry in boundaries]
+            results = [[float(value) for array in values for value in array] for values in polygons_turning_angles_numpy(polygons)]
+            return tuple({vkey: value for vkey, value in zip(vkeys, values)} for values in results)
+
+        angles, kinks, curvatures = {}, {}, {}
+        for bdry in boundaries:
+            n = len(bdry)
+            for i, v in enumerate(bdry):
+                u, w = bdry[i - 1], bdry[(i + 1) % n]
+                uv = subtract_vectors(self.vertex_coordinates(v), self.vertex_coordinates(u))
+                vw = subtract_vectors(self.vertex_coordinates(w), self.vertex_coordinates(v))
+                angles[v] = angle_vectors(uv, vw)
+                curvatures[v] = 2 * angles[v] / (self.edge_length(u, v) + self.edge_length(v, w))
+            for i, v in enumerate(bdry):
+                kinks[v] = angles[v] - (angles[bdry[i - 1]] + angles[bdry[(i + 1) % n]]) / 2
+        return angles, kinks, curvatures
+
     # --------------------------------------------------------------------------
     # branches
     # --------------------------------------------------------------------------
@@ -124,7 +169,8 @@ class SkeletonDecomposition(Skeleton):
             List of polylines as list of point XYZ-coordinates.
 
         """
-        map_corners = [geometric_key(trimesh_face_circle(self, corner)[0]) for corner in self.corner_faces()]
+        geom_keys = self.face_circumcentre_geometric_keys()
+        map_corners = set([geom_keys[corner] for corner in self.corner_faces()])
         return [
             branch for branch in self.branches()
             if geometric_key(branch[0]) not in map_corners and geometric_key(branch[-1]) not in map_corners]
@@ -139,7 +185,7 @@ class SkeletonDecomposition(Skeleton):
 
         """
         return [
-            [trimesh_face_circle(self, fkey)[0], self.vertex_coordinates(vkey)]
+            [self.face_circumcentre(fkey), self.vertex_coordinates(vkey)]
             for fkey in self.singular_faces() for vkey in self.face_vertices(fkey)]
 
     def branches_boundary(self):
@@ -175,8 +221,40 @@ class SkeletonDecomposition(Skeleton):
         branches += self.branches_splitting_boundary_kinks()
         branches += self.branches_splitting_collapsed_boundaries()
         branches += self.branches_splitting_flipped_faces()
-        self.polylines = network_polylines(Network.from_lines([(u, v) for polyline in branches for u, v in pairwise(polyline)]),
-                                           splits=[self.vertex_coordinates(vkey) for vkey in self.corner_vertices()])
+
+        # graph of the branch points, welded by geometric key
+        points = {}
+        adjacency = {}
+        for branch in branches:
+            geom_keys = [geometric_key(xyz) for xyz in branch]
+            for geom_key, xyz in zip(geom_keys, branch):
+                if geom_key not in points:
+                    points[geom_key] = xyz
+                    adjacency[geom_key] = {}
+            for u, v in pairwise(geom_keys):
+                if u != v:
+                    adjacency[u][v] = None
+                    adjacency[v][u] = None
+
+        # chains between the nodes without two neighbours and the corners
+        splits = set([geometric_key(self.vertex_coordinates(vkey)) for vkey in self.corner_vertices()])
+        ends = set([geom_key for geom_key, nbrs in adjacency.items() if len(nbrs) != 2 or geom_key in splits])
+        visited = set()
+        chains = []
+        # in the order of the branches, for the same polylines and mesh keys regardless of the string hashing
+        for geom_key in [geom_key for geom_key in adjacency if geom_key in ends] + list(adjacency):
+            for nbr in adjacency[geom_key]:
+                if (geom_key, nbr) in visited:
+                    continue
+                chain = [geom_key, nbr]
+                while chain[-1] not in ends and chain[-1] != chain[0]:
+                    u, v = chain[-2:]
+                    chain.append([w for w in adjacency[v] if w != u][0])
+                visited.update([(u, v) for u, v in pairwise(chain)] + [(v, u) for u, v in pairwise(chain)])
+                chains.append(chain)
+
+        self.polylines = [[points[geom_key] for geom_key in chain] for chain in chains]
+        self.extremities_to_polyline = {(chain[0], chain[-1]): polyline for chain, polyline in zip(chains, self.polylines)}
         return self.polylines
 
     def decomposition_polyline(self, geom_key_1, geom_key_2):
@@ -194,7 +272,7 @@ class SkeletonDecomposition(Skeleton):
         list, None
             A polyline as a list of point XYZ-coordinates if a polyline corresponds to the geometric keys, None otherwise.
         """
-        polylines = {(geometric_key(polyline[0]), geometric_key(polyline[-1])): polyline for polyline in self.polylines}
+        polylines = self.extremities_to_polyline
         return polylines.get((geom_key_1, geom_key_2), polylines.get((geom_key_2, geom_key_1), None))
 
     def decomposition_mesh(self, poles):
@@ -214,8 +292,9 @@ class SkeletonDecomposition(Skeleton):
         self.mesh = CoarsePseudoQuadMesh.from_polylines(boundary_polylines, other_polylines)
         self.solve_triangular_faces()
         #self.quadrangulate_polygonal_faces()
-        self.split_quads_with_poles(poles)
-        self.store_pole_data(poles)
+        pole_vertices = self.pole_vertices(poles)
+        self.split_quads_with_poles(poles, pole_vertices)
+        self.store_pole_data(poles, pole_vertices)
         return self.mesh
 
     # --------------------------------------------------------------------------
@@ -256,7 +335,7 @@ class SkeletonDecomposition(Skeleton):
                 fkey = list(self.vertex_faces(vkey))[0]
                 for edge in self.face_halfedges(fkey):
                     if vkey in edge and not self.is_edge_on_boundary(*edge):
-                        new_branches += [[trimesh_face_circle(self, fkey)[0], self.vertex_coordinates(vkey_2)] for vkey_2 in edge]
+                        new_branches += [[self.face_circumcentre(fkey), self.vertex_coordinates(vkey_2)] for vkey_2 in edge]
                         all_splits.update(edge)
                         break
 
@@ -272,7 +351,7 @@ class SkeletonDecomposition(Skeleton):
 
         """
         new_branches = []
-        centre_to_fkey = {geometric_key(trimesh_face_circle(self, fkey)[0]): fkey for fkey in self.faces()}
+        centre_to_fkey = {geom_key: fkey for fkey, geom_key in self.face_circumcentre_geometric_keys().items()}
 
         # compute total rotation of polyline
         for polyline in self.branches_singularity_to_singularity():
@@ -297,7 +376,7 @@ class SkeletonDecomposition(Skeleton):
                     fkey = centre_to_fkey[geometric_key(point)]
                     for edge in self.face_halfedges(fkey):
                         if not self.is_edge_on_boundary(*edge):
-                            new_branches += [[trimesh_face_circle(self, fkey)[0], self.vertex_coordinates(vkey)] for vkey in edge]
+                            new_branches += [[self.face_circumcentre(fkey), self.vertex_coordinates(vkey)] for vkey in edge]
                             break
 
         return new_branches
@@ -316,27 +395,22 @@ class SkeletonDecomposition(Skeleton):
         new_branches = []
 
         singular_faces = set(self.singular_faces())
-        for boundary in self.boundaries():
-            angles = {(u, v, w): angle_vectors(subtract_vectors(self.vertex_coordinates(v), self.vertex_coordinates(u)), subtract_vectors(
-                self.vertex_coordinates(w), self.vertex_coordinates(v))) for u, v, w in window(boundary + boundary[: 2], n=3)}
-            for u, v, w, x, y in list(window(boundary + boundary[: 4], n=5)):
-
-                # check if not a corner
-                if self.vertex_degree(w) == 2:
-                    continue
-
-                angle = angles[(v, w, x)]
-                adjacent_angles = (angles[(u, v, w)] + angles[(w, x, y)]) / 2
-
-                if angle - adjacent_angles > self.relative_kink_angle_limit:
-                    # check if not already marked via an adjacent singular face
-                    if all([fkey not in singular_faces for fkey in self.vertex_faces(w)]):
-                        fkeys = list(self.vertex_faces(w, ordered=True))
-                        fkey = fkeys[int(floor(len(fkeys) / 2))]
-                        for edge in self.face_halfedges(fkey):
-                            if w in edge and not self.is_edge_on_boundary(*edge):
-                                new_branches += [[trimesh_face_circle(self, fkey)[0], self.vertex_coordinates(vkey)] for vkey in edge]
-                                break
+        kinks = self.boundary_turning_angles(self.boundaries())[1]
+        for w, kink in kinks.items():
+
+            # check if not a corner
+            if self.vertex_degree(w) == 2:
+                continue
+
+            if kink > self.relative_kink_angle_limit:
+                # check if not already marked via an adjacent singular face
+                if all([fkey not in singular_faces for fkey in self.vertex_faces(w)]):
+                    fkeys = list(self.vertex_faces(w, ordered=True))
+                    fkey = fkeys[int(floor(len(fkeys) / 2))]
+                    for edge in self.face_halfedges(fkey):
+                        if w in edge and not self.is_edge_on_boundary(*edge):
+                            new_branches += [[self.face_circumcentre(fkey), self.vertex_coordinates(vkey)] for vkey in edge]
+                            break
 
         return new_branches
 
@@ -344,56 +418,67 @@ class SkeletonDecomposition(Skeleton):
         """Modify the decomposition mesh from polylines to make it a quad mesh by converting the degenerated quad faces that appear as triangular faces.
         """
         mesh = self.mesh
+        on_boundary = set([vkey for vkey in mesh.vertices() if mesh.is_vertex_on_boundary(vkey)])
+
+        for fkey in [fkey for fkey in mesh.faces() if len(mesh.face_vertices(fkey)) == 3]:
+            if len(mesh.face_vertices(fkey)) != 3:
+                continue
+
+            boundary_vertices = [vkey for vkey in mesh.face_vertices(fkey) if vkey in on_boundary]
+            case = len(boundary_vertices)
+
+            if case == 1:
+                # convert triangular face to quad by duplicating the boundary vertex
+                # due to singular face vertices at the same location
+                u = boundary_vertices[0]
+                v = mesh.add_vertex(attr_dict={attr: xyz for attr, xyz in zip(['x', 'y', 'z'], mesh.vertex_coordinates(u))})
+                on_boundary.add(v)
+
+                # modify adjacent faces
+                vertex_faces = mesh.vertex_faces(u, ordered=True)
+                mesh_substitute_vertex_in_faces(mesh, u, v, vertex_faces[: vertex_faces.index(fkey)])
+
+                # modify triangular face, inserting the new vertex on the edge to its ancestor
+                w = mesh.face_vertex_ancestor(fkey, u)
+                for face, halfedge in zip(mesh.edge_faces(u, w), [(u, w), (w, u)]):
+                    if face is not None:
+                        face_vertices = mesh.face_vertices(face)[:]
+                        face_vertices.insert(face_vertices.index(halfedge[-1]), v)
+                        mesh.delete_face(face)
+                        mesh.add_face(face_vertices, face)
+
+            elif case == 2:
+                # remove triangular face and merge the two boundary vertices
+                # due to singularities at the same location
+                polyline = Polyline(self.decomposition_polyline(*map(lambda x: geometric_key(mesh.vertex_coordinates(x)), boundary_vertices)))
+                point = polyline.point(t=.5, snap=True)
+                new_vkey = mesh.add_vertex(attr_dict={'x': point.x, 'y': point.y, 'z': point.z})
+                on_boundary.add(new_vkey)
+
+                # modify triangular face
+                mesh.delete_face(fkey)
+
+                # modify adjacent faces
+                for old_vkey in boundary_vertices:
+                    mesh_substitute_vertex_in_faces(mesh, old_vkey, new_vkey, mesh.vertex_faces(old_vkey))
+                    mesh.delete_vertex(old_vkey)
+                    on_boundary.discard(old_vkey)
 
-        for fkey in list(mesh.faces()):
-            if len(mesh.face_vertices(fkey)) == 3:
-
-                boundary_vertices = [vkey for vkey in mesh.face_vertices(fkey) if mesh.is_vertex_on_boundary(vkey)]
-                case = sum(mesh.is_vertex_on_boundary(vkey) for vkey in mesh.face_vertices(fkey))
-
-                if case == 1:
-                    # convert triangular face to quad by duplicating the boundary vertex
-                    # due to singular face vertices at the same location
-                    u = boundary_vertices[0]
-                    v = mesh.add_vertex(attr_dict={attr: xyz for attr, xyz in zip(['x', 'y', 'z'], mesh.vertex_coordinates(u))})
-
-                    # modify adjacent faces
-                    vertex_faces = mesh.vertex_faces(u, ordered=True)
-                    mesh_substitute_vertex_in_faces(mesh, u, v, vertex_faces[: vertex_faces.index(fkey)])
-
-                    # modify triangular face
-                    mesh_insert_vertex_on_edge(mesh, u, mesh.face_vertex_ancestor(fkey, u), v)
-
-                elif case == 2:
-                    # remove triangular face and merge the two boundary vertices
-                    # due to singularities at the same location
-                    polyline = Polyline(self.decomposition_polyline(*map(lambda x: geometric_key(mesh.vertex_coordinates(x)), boundary_vertices)))
-                    point = polyline.point(t=.5, snap=True)
-                    new_vkey = mesh.add_vertex(attr_dict={'x': point.x, 'y': point.y, 'z': point.z})
-
-                    # modify triangular face
-                    mesh.delete_face(fkey)
-
-                    # modify adjacent faces
-                    for old_vkey in boundary_vertices:
-                        mesh_substitute_vertex_in_faces(mesh, old_vkey, new_vkey, mesh.vertex_faces(old_vkey))
-                        mesh.delete_vertex(old_vkey)
-
-        to_move = {}
         # give some length to the new edge
-        for edge in mesh.edges():
-            threshold = 1e-6
-            if mesh.edge_length(*edge) < threshold:
-                for vkey in edge:
-                    xyz = centroid_points([mesh.vertex_coordinates(nbr) for nbr in mesh.vertex_neighbors(vkey)])
-                    xyz0 = mesh.vertex_coordinates(vkey)
-                    to_move[vkey] = [0.1 * (a - a0) for a, a0 in zip(xyz, xyz0)]
-
-        for vkey, xyz in to_move.items():
+        threshold = 1e-6
+        xyz = {vkey: mesh.vertex_coordinates(vkey) for vkey in mesh.vertices()}
+        to_move = {}
+        for u, v in mesh.edges():
+            if distance_point_point(xyz[u], xyz[v]) < threshold:
+                for vkey in (u, v):
+                    centroid = centroid_points([xyz[nbr] for nbr in mesh.vertex_neighbors(vkey)])
+                    to_move[vkey] = [0.1 * (a - a0) for a, a0 in zip(centroid, xyz[vkey])]
+
+        for vkey, vector in to_move.items():
             attr = mesh.vertex[vkey]
-            attr['x'] += xyz[0]
-            attr['y'] += xyz[1]
-            attr['z'] += xyz[2]
+            attr['x'] += vector[0]
+            attr['y'] += vector[1]
+            attr['z'] += vector[2]
 
     def quadrangulate_polygonal_faces(self):
         # WIP: problem not all faces should have the same source for propagation
@@ -430,18 +515,53 @@ class SkeletonDecomposition(Skeleton):
         # 	face_vertices = mesh.face_vertices(fkey)
         # 	if len(face_vertices) > 4:
 
-    def split_quads_with_poles(self, poles):
+    def pole_vertices(self, poles, tol=1e-3):
+        """Resolve the poles to the vertices of the decomposition mesh at their location, through a hash grid of the vertices.
+
+        Parameters
+        ----------
+        poles : list
+            List of pole XYZ-coordinates.
+        tol : float, optional
+            Distance tolerance between a pole and a vertex. Default is 1e-3.
+
+        Returns
+        -------
+        set
+            The keys of the vertices at the poles, including the coincident ones.
+
+        """
+        mesh = self.mesh
+
+        def cell(xyz):
+            return tuple(int(floor(x / tol)) for x in xyz)
+
+        grid = {}
+        for vkey in mesh.vertices():
+            grid.setdefault(cell(mesh.vertex_coordinates(vkey)), []).append(vkey)
+
+        vkeys = set()
+        for pole in poles:
+            i, j, k = cell(pole)
+            for key in product(range(i - 1, i + 2), range(j - 1, j + 2), range(k - 1, k + 2)):
+                for vkey in grid.get(key, []):
+                    if distance_point_point(pole, mesh.vertex_coordinates(vkey)) <= tol:
+                        vkeys.add(vkey)
+        return vkeys
+
+    def split_quads_with_poles(self, poles, pole_vertices=None):
         new_lines = []
 
         mesh = self.mesh
-        pole_map = tuple([geometric_key(pole) for pole in poles])
+        if pole_vertices is None:
+            pole_vertices = self.pole_vertices(poles)
 
         faces = list(mesh.faces())
         for fkey in faces:
             fv = mesh.face_vertices(fkey)
             if len(fv) == 4:
                 for vkey in fv:
-                    if geometric_key(mesh.vertex_coordinates(vkey)) in pole_map:
+                    if vkey in pole_vertices:
                         idx = fv.index(vkey)
                         xkey = fv[idx + 2 - len(fv)]
                         new_lines.append([mesh.vertex_coordinates(vkey), mesh.vertex_coordinates(xkey)])
@@ -449,17 +569,19 @@ class SkeletonDecomposition(Skeleton):
                         break
 
         self.polylines += new_lines
+        self.extremities_to_polyline.update({(geometric_key(line[0]), geometric_key(line[-1])): line for line in new_lines})
         return new_lines
 
-    def store_pole_data(self, poles):
+    def store_pole_data(self, poles, pole_vertices=None):
         mesh = self.mesh
-        pole_map = tuple([geometric_key(pole) for pole in poles])
+        if pole_vertices is None:
+            pole_vertices = self.pole_vertices(poles)
 
         face_poles = {}
         for fkey in mesh.faces():
             if len(mesh.face_vertices(fkey)) == 3:
                 for vkey in mesh.face_vertices(fkey):
-                    if geometric_key(mesh.vertex_coordinates(vkey)) in pole_map:
+                    if vkey in pole_vertices:
                         face_poles[fkey] = vkey
                         break
                 if fkey not in face_poles:
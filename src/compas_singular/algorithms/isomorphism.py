@@ -25,9 +25,10 @@ def strip_graph(mesh, close_strip_data=False):
     # graph vertices have an attribute whether the corresponding strip is closed or not
     if mesh.attributes['strips'] is None or mesh.attributes['strips'] == {}:
         mesh.collect_strips()
-    graph = nx.MultiGraph([tuple(mesh.face_strips(fkey)) for fkey in mesh.faces()])
+    compact_graph = mesh.compact_strip_graph()
+    graph = nx.MultiGraph(compact_graph.edges())
     if close_strip_data:
-        nx.set_node_attributes(graph, {skey: {'closed': mesh.is_strip_closed(skey)} for skey in mesh.strips()})
+        nx.set_node_attributes(graph, {skey: {'closed': closed} for skey, closed in zip(compact_graph.strip_keys, compact_graph.closed)})
     return graph
 
 
@@ -0,0 +1,288 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import json
+import marshal
+import time
+from copy import deepcopy
+from hashlib import sha1
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from .triangulation import boundary_triangulation
+from .decomposition import SkeletonDecomposition
+
+
+__all__ = ['DecompositionPipeline']
+
+
+class DecompositionPipeline(object):
+    """DecompositionPipeline class to go from planar boundaries to a dense quad mesh, chaining the decomposition stages:
+    resampling, triangulation, decomposition, strips and densification.
+
+    Each stage result is cached under a hash of the input data and of the parameters of the stage and the upstream ones,
+    so that changing a parameter only re-runs the stages from the one it belongs to.
+    The cached results are copied before being passed to the next stage or returned, so that they are never modified.
+    The wall time of the stages run last is recorded, and optionally the peak memory allocated by Python, which slows the stages down.
+
+    Parameters
+    ----------
+    outer_boundary : list
+        Planar outer boundary as list of vertex coordinates.
+    inner_boundaries : list
+        List of planar inner boundaries as lists of vertex coordinates.
+    polyline_features : list
+        List of planar polyline_features as lists of vertex coordinates.
+    point_features : list
+        List of planar point_features as lists of vertex coordinates.
+    cache : dict, optional
+        Cache of stage results to share between pipelines. Default is a new cache.
+    trace_memory : bool, optional
+        Whether to trace the peak memory allocated per stage. Default is False.
+
+    Attributes
+    ----------
+    parameters : dict
+        The stage parameters:
+        'resampling', the keyword arguments of ``boundary_resampling_numpy``, None to skip the resampling;
+        'delaunay' and 'constrained_delaunay', the triangulation functions of ``boundary_triangulation``;
+        'target_length', the target length of the strip densities.
+    timings : dict
+        The wall time in seconds per stage run last, zero if the result was cached.
+    memory : dict
+        The peak memory in bytes allocated per stage run last, None if the result was cached or if the memory is not traced.
+
+    Examples
+    --------
+    >>> pipeline = DecompositionPipeline(outer_boundary, inner_boundaries, polyline_features, point_features)  # doctest: +SKIP
+    >>> densemesh = pipeline.run()  # doctest: +SKIP
+    >>> pipeline.parameters['target_length'] = 0.25  # doctest: +SKIP
+    >>> densemesh = pipeline.run()  # only the densification is re-run  # doctest: +SKIP
+
+    """
+
+    stages = ['resampling', 'triangulation', 'decomposition', 'strips', 'densification']
+
+    stage_parameters = {
+        'resampling': ['resampling'],
+        'triangulation': ['delaunay', 'constrained_delaunay'],
+        'decomposition': [],
+        'strips': [],
+        'densification': ['target_length'],
+    }
+
+    def __init__(self, outer_boundary, inner_boundaries, polyline_features=[], point_features=[], cache=None, trace_memory=False):
+        self.data = [outer_boundary, inner_boundaries, polyline_features, point_features]
+        self.parameters = {
+            'resampling': None,
+            'delaunay': None,
+            'constrained_delaunay': None,
+            'target_length': 1.,
+        }
+        self.cache = cache if cache is not None else {}
+        self.trace_memory = trace_memory
+        self.timings = {}
+        self.memory = {}
+
+    # --------------------------------------------------------------------------
+    # keys
+    # --------------------------------------------------------------------------
+
+    def input_key(self):
+        """Hash of the input data.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest of the input data.
+
+        """
+        return sha1(json.dumps(self.data).encode('utf-8')).hexdigest()
+
+    def stage_key(self, stage):
+        """Hash of the input data and of the parameters of a stage and of the upstream stages.
+
+        Parameters
+        ----------
+        stage : str
+            The stage name.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest identifying the stage result.
+
+        """
+        key = self.input_key()
+        for name in self.stages[: self.stages.index(stage) + 1]:
+            parameters = [(parameter, parameter_key(self.parameters[parameter])) for parameter in self.stage_parameters[name]]
+            key = sha1(json.dumps([key, name, parameters]).encode('utf-8')).hexdigest()
+        return key
+
+    # --------------------------------------------------------------------------
+    # stages
+    # --------------------------------------------------------------------------
+
+    def resampling(self, data):
+        if self.parameters['resampling'] is None:
+            return data
+        from .resampling_numpy import boundary_resampling_numpy
+        return list(boundary_resampling_numpy(*data, **self.parameters['resampling']))
+
+    def triangulation(self, data):
+        return boundary_triangulation(*data, delaunay=self.parameters['delaunay'], constrained_delaunay=self.parameters['constrained_delaunay'])
+
+    def decomposition(self, trimesh):
+        decomposition = SkeletonDecomposition.from_mesh(trimesh)
+        return decomposition.decomposition_mesh(self.data[3])
+
+    def strips(self, coarsemesh):
+        coarsemesh.collect_strips()
+        return coarsemesh
+
+    def densification(self, coarsemesh):
+        coarsemesh.set_strips_density_target(self.parameters['target_length'])
+        coarsemesh.densification()
+        return coarsemesh.get_quad_mesh()
+
+    # --------------------------------------------------------------------------
+    # run
+    # --------------------------------------------------------------------------
+
+    def result(self, stage):
+        """Get the result of a stage, running it and the upstream stages if they are not cached.
+
+        Parameters
+        ----------
+        stage : str
+            The stage name.
+
+        Returns
+        -------
+        list, Mesh, CoarsePseudoQuadMesh or QuadMesh
+            The stage result: the input data for the resampling, the Delaunay mesh for the triangulation,
+            the coarse quad mesh for the decomposition and the strips, the dense quad mesh for the densification.
+
+        """
+        return copy_result(self.cached_result(stage))
+
+    def cached_result(self, stage):
+        """Get the cached result of a stage, running it and the upstream stages if they are not cached.
+        The result must not be modified.
+
+        Parameters
+        ----------
+        stage : str
+            The stage name.
+
+        Returns
+        -------
+        list, Mesh, CoarsePseudoQuadMesh or QuadMesh
+            The cached stage result.
+
+        """
+        key = self.stage_key(stage)
+        if key in self.cache:
+            self.timings[stage] = 0.
+            self.memory[stage] = None
+            return self.cache[key]
+
+        index = self.stages.index(stage)
+        upstream = copy_result(self.cached_result(self.stages[index - 1]) if index > 0 else self.data)
+
+        tracing = self.trace_memory and tracemalloc is not None and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        t0 = time.time()
+        result = getattr(self, stage)(upstream)
+        self.timings[stage] = time.time() - t0
+        self.memory[stage] = tracemalloc.get_traced_memory()[1] if tracing else None
+        if tracing:
+            tracemalloc.stop()
+
+        self.cache[key] = result
+        return result
+
+    def run(self, stage='densification'):
+        """Run the pipeline up to a stage, re-using the cached stage results.
+
+        Parameters
+        ----------
+        stage : str, optional
+            The last stage to run. Default is the densification.
+
+        Returns
+        -------
+        list, Mesh, CoarsePseudoQuadMesh or QuadMesh
+            The result of the last stage.
+
+        """
+        self.timings = {}
+        self.memory = {}
+        return self.result(stage)
+
+    def report(self):
+        """Report of the wall time and peak memory of the stages run last.
+
+        Returns
+        -------
+        str
+            One line per stage.
+
+        """
+        lines = []
+        for stage in self.stages:
+            if stage in self.timings:
+                memory = '-' if self.memory[stage] is None else '{:.1f} MB'.format(self.memory[stage] / 1e6)
+                lines.append('{:<16}{:>10.3f} s{:>12}'.format(stage, self.timings[stage], memory))
+        return '\n'.join(lines)
+
+
+def parameter_key(value, seen=None):
+    """JSON-serialisable key of a stage parameter.
+    Functions are identified by their module, qualified name, a hash of their code, their default arguments and their closure values,
+    other callables by their module, qualified name and representation. NumPy arrays and scalars are converted to lists and numbers.
+    """
+    if isinstance(value, dict):
+        return [[str(key), parameter_key(value[key], seen)] for key in sorted(value, key=str)]
+    if isinstance(value, (list, tuple)):
+        return [parameter_key(item, seen) for item in value]
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if callable(value):
+        name = '{}.{}'.format(getattr(value, '__module__', ''), getattr(value, '__qualname__', getattr(value, '__name__', '')))
+        code = getattr(value, '__code__', None)
+        if code is None:
+            return [name, repr(value)]
+        # functions already being keyed, in recursive closures
+        seen = seen or set()
+        if id(value) in seen:
+            return name
+        seen.add(id(value))
+        closure = [cell.cell_contents for cell in value.__closure__ or []]
+        return [name, sha1(marshal.dumps(code)).hexdigest(), parameter_key(value.__defaults__ or [], seen), parameter_key(closure, seen)]
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return repr(value)
+    return value
+
+
+def copy_result(result):
+    """Copy of a stage result, the input data or a mesh.
+    """
+    if isinstance(result, (list, tuple)):
+        return deepcopy(result)
+    return result.copy()
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
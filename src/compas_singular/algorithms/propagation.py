@@ -2,10 +2,15 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+import compas
+
 from compas.geometry import discrete_coons_patch
 
 from ..utilities import list_split
 
+if not compas.IPY:
+    from ..geometry import discrete_coons_patch_numpy
+
 
 __all__ = [
     'quadrangulate_mesh',
@@ -17,35 +22,55 @@ __all__ = [
 
 def quadrangulate_mesh(mesh, sources):
     """Quadrangulate the faces of a mesh by adding edges from vertex sources.
+    The sources are visited from a worklist and each polygonal face is processed at most once.
 
-    Returns
-    -------
+    Parameters
+    ----------
     mesh : Mesh
         A mesh to quadrangulate.
     sources : list
         A list of vertex keys to use as sources to add edges for quandrangulation.
+        The new vertices added on the face edges are appended to it as new sources.
+
+    Returns
+    -------
+    int
+        The number of quadrangulated faces.
 
     References
     ----------
     .. [1] Oval et al., *Feature-based Topology Finding of Patterns for Shell Structures*. Automation in Construction. 2019.
 
     """
+    source_set = set(sources)
     sources_to_visit = sources[:]
+    to_visit = set(sources_to_visit)
+    visited_faces = set()
+    count = 0
 
-    count = 1000
-    while sources_to_visit and count:
-        count -= 1
-
+    while sources_to_visit:
         vkey = sources_to_visit.pop()
+        # skip the sources removed from the worklist when visiting a face
+        if vkey not in to_visit:
+            continue
+        to_visit.remove(vkey)
+
         for fkey in mesh.vertex_faces(vkey):
+            if fkey in visited_faces:
+                continue
             face_vertices = mesh.face_vertices(fkey)[:]
             if len(face_vertices) != 4:
-                new_sources = quadrangulate_face(mesh, fkey, sources)
-                for vkey in face_vertices:
-                    if vkey in sources_to_visit:
-                        sources_to_visit.remove(vkey)
+                visited_faces.add(fkey)
+                new_sources = quadrangulate_face(mesh, fkey, source_set)
+                if fkey not in mesh.face:
+                    count += 1
+                to_visit.difference_update(face_vertices)
+                source_set.update(new_sources)
                 sources += new_sources
                 sources_to_visit += new_sources
+                to_visit.update(new_sources)
+
+    return count
 
 
 def quadrangulate_face(mesh, fkey, sources):
@@ -53,7 +78,6 @@ def quadrangulate_face(mesh, fkey, sources):
     face_vertices = mesh.face_vertices(fkey)[:]
 
     # differentiate sources and non sources
-    sources = [vkey for vkey in face_vertices if vkey in sources]
     non_sources = [vkey for vkey in face_vertices if vkey not in sources]
     new_sources = []
 
@@ -114,7 +138,10 @@ def discrete_coons_patch_mesh(mesh, ab, bc, dc, ad):
     dc_xyz = [mesh.vertex_coordinates(vkey) for vkey in dc]
     ad_xyz = [mesh.vertex_coordinates(vkey) for vkey in ad]
 
-    coons_vertices, coons_face_vertices = discrete_coons_patch(ab_xyz, bc_xyz, dc_xyz, ad_xyz)
+    if compas.IPY:
+        coons_vertices, coons_face_vertices = discrete_coons_patch(ab_xyz, bc_xyz, dc_xyz, ad_xyz)
+    else:
+        coons_vertices, coons_face_vertices = [array.tolist() for array in discrete_coons_patch_numpy(ab_xyz, bc_xyz, dc_xyz, ad_xyz)]
 
     n = len(ab)
     m = len(bc)
@@ -133,13 +160,10 @@ def discrete_coons_patch_mesh(mesh, ab, bc, dc, ad):
     for i, vkey in enumerate(dc):
         vertex_index_map[m - 1 + i * m] = vkey
 
-    max_vkey = max(list(mesh.vertices()))
-
+    # new vertex keys from the maintained maximum key of the mesh
     for i, vertex in enumerate(coons_vertices):
         if i not in vertex_index_map:
-            max_vkey += 1
-            vertex_index_map[i] = max_vkey
-            mesh.add_vertex(max_vkey, attr_dict={xyz: value for xyz, value in zip(['x', 'y', 'z'], vertex)})
+            vertex_index_map[i] = mesh.add_vertex(attr_dict={xyz: value for xyz, value in zip(['x', 'y', 'z'], vertex)})
 
     for face in coons_face_vertices:
         mesh.add_face(list(reversed([vertex_index_map[vkey] for vkey in face])))
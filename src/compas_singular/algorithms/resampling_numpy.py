@@ -0,0 +1,294 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from math import ceil
+from math import pi
+
+from numpy import arange
+from numpy import arccos
+from numpy import asarray
+from numpy import clip
+from numpy import concatenate
+from numpy import cumsum
+from numpy import errstate
+from numpy import fmin
+from numpy import full
+from numpy import inf
+from numpy import interp
+from numpy import minimum
+from numpy import zeros
+
+from scipy.spatial import cKDTree
+
+from compas.utilities import geometric_key
+
+from ..geometry import polygons_turning_angles_numpy
+
+from .triangulation import boundary_triangulation
+from .decomposition import SkeletonDecomposition
+
+
+__all__ = [
+    'boundary_resampling_numpy'
+]
+
+
+def boundary_resampling_numpy(outer_boundary, inner_boundaries, polyline_features=[], point_features=[],
+                              max_length=None, feature_ratio=1., angle_tolerance=pi / 4, kink_angle=pi / 6,
+                              preserve_topology=False, delaunay=None, max_refinements=4):
+    """Resample the boundaries and the feature polylines of a decomposition input adaptively,
+    with a point spacing following the local feature size and the curvature.
+
+    The kinks, the extremities of the feature polylines and the points shared between polylines or with the point features are kept.
+    The other points are replaced by points along the input polylines, spaced by the target length at their location:
+    the smallest of the maximum length, the local feature size times the feature ratio and the angle tolerance divided by the curvature.
+    The local feature size of a point is the distance to the closest distinct point of another polyline or of the same polyline further along it
+    than twice this distance, i.e. across a narrow part of the domain.
+
+    The resampling does not guarantee the same skeleton decomposition as the input, as the skeleton depends on the boundary discretisation.
+    With ``preserve_topology``, the points are selected among the input points with the same spacing instead of interpolated,
+    and the input and the resampled input are decomposed. The resampling is refined, halving the maximum length, the feature ratio
+    and the angle tolerance, until the coarse quad meshes have the same topology,
+    i.e. the same numbers of faces and degrees of the boundary and interior vertices.
+    The refinements keep more and more input points, up to all of them, so the first match is a reduced input with the same topology.
+    The input is returned unchanged if it cannot be decomposed or if no refinement matches.
+
+    Parameters
+    ----------
+    outer_boundary : list
+        Planar outer boundary as list of vertex coordinates.
+    inner_boundaries : list
+        List of planar inner boundaries as lists of vertex coordinates.
+    polyline_features : list
+        List of planar polyline_features as lists of vertex coordinates.
+    point_features : list
+        List of planar point_features as lists of vertex coordinates.
+    max_length : float, optional
+        Maximum spacing between points. Default is no maximum.
+    feature_ratio : float, optional
+        Ratio between the spacing and the local feature size. Default is 1.
+    angle_tolerance : float, optional
+        Maximum turning angle in rad between consecutive resampled segments along smooth parts. Default is pi / 4.
+    kink_angle : float, optional
+        Minimum turning angle in rad for a point to be kept as a kink. Default is pi / 6.
+    preserve_topology : bool, optional
+        Whether to select input points and refine the selection until the decomposition has the same topology as the one of the input.
+        Default is False.
+    delaunay : callable, optional
+        Delaunay triangulation function of ``boundary_triangulation`` for the topology checks.
+    max_refinements : int, optional
+        Maximum number of refinements for the topology checks. Default is 4.
+
+    Returns
+    -------
+    tuple
+        The resampled outer boundary, inner boundaries and polyline features, and the point features, as input to ``boundary_triangulation``.
+
+    """
+    if not preserve_topology:
+        return resample(outer_boundary, inner_boundaries, polyline_features, point_features, max_length, feature_ratio, angle_tolerance, kink_angle)
+
+    topology = decomposition_topology(outer_boundary, inner_boundaries, polyline_features, point_features, delaunay)
+    for k in range(max_refinements + 1 if topology is not None else 0):
+        resampled = resample(outer_boundary, inner_boundaries, polyline_features, point_features, max_length, feature_ratio, angle_tolerance, kink_angle,
+                             subset=True)
+        if decomposition_topology(*resampled, delaunay=delaunay) == topology:
+            return resampled
+        max_length = max_length / 2 if max_length else max_length
+        feature_ratio /= 2
+        angle_tolerance /= 2
+
+    return [list(point) for point in outer_boundary], [[list(point) for point in polyline] for polyline in inner_boundaries], \
+        [[list(point) for point in polyline] for polyline in polyline_features], point_features
+
+
+def decomposition_topology(outer_boundary, inner_boundaries, polyline_features=[], point_features=[], delaunay=None):
+    """Topology of the coarse quad mesh of the skeleton decomposition of an input, None if the decomposition fails:
+    the number of faces and the sorted degrees of the boundary and interior vertices.
+    """
+    try:
+        trimesh = boundary_triangulation(outer_boundary, inner_boundaries, polyline_features, point_features, delaunay=delaunay)
+        coarsemesh = SkeletonDecomposition.from_mesh(trimesh).decomposition_mesh(point_features)
+    except Exception:
+        return None
+    boundary = sorted(coarsemesh.vertex_degree(vkey) for vkey in coarsemesh.vertices() if coarsemesh.is_vertex_on_boundary(vkey))
+    interior = sorted(coarsemesh.vertex_degree(vkey) for vkey in coarsemesh.vertices() if not coarsemesh.is_vertex_on_boundary(vkey))
+    return coarsemesh.number_of_faces(), boundary, interior
+
+
+def resample(outer_boundary, inner_boundaries, polyline_features, point_features, max_length, feature_ratio, angle_tolerance, kink_angle, subset=False):
+    """Adaptive resampling of the polylines of a decomposition input, without topology check.
+    With ``subset``, the points are selected among the input points instead of interpolated along the polylines.
+    """
+    polylines = [outer_boundary] + list(inner_boundaries) + list(polyline_features)
+    closed = [True] * (1 + len(inner_boundaries)) + [False] * len(polyline_features)
+    points = [asarray(polyline, dtype=float).reshape((-1, 3)) for polyline in polylines]
+
+    # arc length along each polyline, up to the closing point for the closed ones
+    arcs = []
+    for xyz, is_closed in zip(points, closed):
+        if is_closed:
+            xyz = concatenate([xyz, xyz[:1]])
+        lengths = ((xyz[1:] - xyz[:-1]) ** 2).sum(axis=1) ** .5
+        arcs.append(concatenate([[0.], cumsum(lengths)]))
+
+    angles, curvatures = turning_angles(points, closed)
+    sizes = local_feature_sizes(points, closed, arcs, point_features)
+
+    # target length per point
+    targets = []
+    for size, curvature in zip(sizes, curvatures):
+        with errstate(divide='ignore'):
+            target = fmin(feature_ratio * size, angle_tolerance / curvature)
+        if max_length:
+            target = minimum(target, max_length)
+        targets.append(target)
+
+    # points to keep: kinks, extremities and points shared between polylines or with the point features
+    count = {}
+    for polyline in polylines:
+        for geom_key in set([geometric_key(xyz) for xyz in polyline]):
+            count[geom_key] = count.get(geom_key, 0) + 1
+    for xyz in point_features:
+        count[geometric_key(xyz)] = count.get(geometric_key(xyz), 0) + 1
+
+    resampled = []
+    for polyline, xyz, arc, angle, target, is_closed in zip(polylines, points, arcs, angles, targets, closed):
+        n = len(polyline)
+        pins = [i for i in range(n) if angle[i] > kink_angle or count[geometric_key(polyline[i])] > 1]
+        if not is_closed:
+            pins = sorted(set([0, n - 1] + pins))
+        elif not pins:
+            pins = [int(angle.argmax())]
+
+        # point density per unit length, integrated along the polyline
+        density = 1. / target
+        if is_closed:
+            xyz = concatenate([xyz, xyz[:1]])
+            density = concatenate([density, density[:1]])
+        integral = concatenate([[0.], cumsum((arc[1:] - arc[:-1]) * (density[1:] + density[:-1]) / 2)])
+
+        spans = list(zip(pins, pins[1:])) + ([(pins[-1], pins[0] + n)] if is_closed else [])
+        points_resampled = []
+        for a, b in spans:
+            if subset:
+                points_resampled += [xyz[i % n].tolist() for i in subset_indices(integral, a, b, n, is_closed and len(spans) == 1)]
+                continue
+            points_resampled.append(xyz[a % n].tolist())
+            span_integral = integral[b] - integral[a] if b <= n else integral[n] - integral[a] + integral[b - n]
+            segments = max(3 if is_closed and len(spans) == 1 else 1, int(ceil(span_integral - 1e-6)))
+            for k in range(1, segments):
+                value = integral[a] + span_integral * k / segments
+                if is_closed and value > integral[n]:
+                    value -= integral[n]
+                s = interp(value, integral, arc)
+                points_resampled.append([float(interp(s, arc, xyz[:, i])) for i in range(3)])
+        if not is_closed:
+            points_resampled.append(xyz[pins[-1]].tolist())
+        resampled.append(points_resampled)
+
+    i = 1 + len(inner_boundaries)
+    return resampled[0], resampled[1: i], resampled[i:], point_features
+
+
+def subset_indices(integral, a, b, n, loop):
+    """Indices of the input points kept along a span between two pins, from the start pin and without the end pin,
+    with at most one unit of integrated point density between consecutive points unless they are consecutive input points.
+    At least three points are kept along a loop with a single pin.
+    """
+    def value(i):
+        return integral[i] if i <= n else integral[n] + integral[i - n]
+
+    indices = [a]
+    i = a
+    while i < b:
+        j = i + 1
+        while j < b and value(j + 1) - value(i) <= 1. + 1e-6:
+            j += 1
+        indices.append(j)
+        i = j
+    indices = indices[:-1]
+    if loop and len(indices) < 3:
+        indices = sorted(set([a + (b - a) * k // 3 for k in range(3)]))
+    return indices
+
+
+def turning_angles(points, closed):
+    """Turning angles and curvatures at the points of closed and open polylines, zero at the open extremities.
+    """
+    loops = [xyz for xyz, is_closed in zip(points, closed) if is_closed]
+    loop_angles, _, loop_curvatures = polygons_turning_angles_numpy(loops)
+
+    angles, curvatures = [], []
+    for xyz, is_closed in zip(points, closed):
+        if is_closed:
+            angles.append(loop_angles.pop(0))
+            curvatures.append(loop_curvatures.pop(0))
+            continue
+        angle, curvature = zeros(len(xyz)), zeros(len(xyz))
+        if len(xyz) > 2:
+            u, v = xyz[1:-1] - xyz[:-2], xyz[2:] - xyz[1:-1]
+            lu, lv = (u ** 2).sum(axis=1) ** .5, (v ** 2).sum(axis=1) ** .5
+            with errstate(divide='ignore', invalid='ignore'):
+                angle[1:-1] = arccos(clip((u * v).sum(axis=1) / (lu * lv), -1., 1.))
+                curvature[1:-1] = 2 * angle[1:-1] / (lu + lv)
+        angles.append(angle)
+        curvatures.append(curvature)
+    return angles, curvatures
+
+
+def local_feature_sizes(points, closed, arcs, point_features):
+    """Local feature sizes at the points of the polylines: distance to the closest distinct point of another polyline, of a point feature,
+    or of the same polyline further along it than twice this distance.
+    """
+    xyz = concatenate(points)
+    ids = concatenate([full(len(p), i) for i, p in enumerate(points)])
+    s = concatenate([arc[:len(p)] for arc, p in zip(arcs, points)])
+    loop_lengths = asarray([arc[-1] if is_closed else inf for arc, is_closed in zip(arcs, closed)])
+    features = asarray(point_features, dtype=float).reshape((-1, 3))
+
+    def excluded_points(rows, nbrs, distances):
+        along = abs(s[rows, None] - s[nbrs])
+        along = minimum(along, loop_lengths[ids[rows], None] - along)
+        return ((ids[rows, None] == ids[nbrs]) & (along <= 2 * distances)) | (distances == 0)
+
+    def excluded_features(rows, nbrs, distances):
+        return distances == 0
+
+    sizes = nearest_distances(xyz, xyz, excluded_points)
+    if len(features):
+        sizes = minimum(sizes, nearest_distances(features, xyz, excluded_features))
+
+    return [sizes[i: i + len(p)] for i, p in zip(cumsum([0] + [len(p) for p in points]), points)]
+
+
+def nearest_distances(points, xyz, excluded, k=16):
+    """Distances from query points to the closest of the points that is not excluded, with a k-d tree of the points.
+    The number of neighbours queried is doubled for the query points whose neighbours are all excluded.
+    """
+    tree = cKDTree(points)
+    n = len(points)
+    distances_min = full(len(xyz), inf)
+    rows = arange(len(xyz))
+    k = min(k, n)
+    while len(rows) and k:
+        distances, nbrs = tree.query(xyz[rows], k=k)
+        distances, nbrs = distances.reshape((len(rows), k)), nbrs.reshape((len(rows), k))
+        distances[excluded(rows, nbrs, distances)] = inf
+        best = distances.min(axis=1)
+        found = best < inf
+        distances_min[rows[found]] = best[found]
+        if k == n:
+            break
+        rows = rows[~found]
+        k = min(2 * k, n)
+    return distances_min
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
@@ -2,10 +2,13 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+import compas
+
 from compas.geometry import is_point_in_polygon_xy
 from compas.geometry import length_vector
 from compas.geometry import subtract_vectors
 from compas.geometry import cross_vectors
+from compas.geometry import centroid_points
 from compas.geometry import delaunay_from_points
 from compas.datastructures import trimesh_face_circle
 from compas.datastructures import mesh_unweld_edges
@@ -14,13 +17,20 @@ from compas.utilities import geometric_key
 
 from ..datastructures import Mesh
 
+if not compas.IPY:
+    from numpy import array
+    from numpy import cross
+    from ..geometry import circumcentres_numpy
+    from ..geometry import is_point_in_polygon_xy_numpy
+
 
 __all__ = [
-    'boundary_triangulation'
+    'boundary_triangulation',
+    'constrained_delaunay_triangle'
 ]
 
 
-def boundary_triangulation(outer_boundary, inner_boundaries, polyline_features=[], point_features=[], delaunay=None):
+def boundary_triangulation(outer_boundary, inner_boundaries, polyline_features=[], point_features=[], delaunay=None, constrained_delaunay=None):
     """Generate Delaunay triangulation between a planar outer boundary and planar inner boundaries. All vertices lie the boundaries.
 
     Parameters
@@ -35,6 +45,10 @@ def boundary_triangulation(outer_boundary, inner_boundaries, polyline_features=[
         List of planar point_features as lists of vertex coordinates.
     delaunay : callable or proxy
         Delaunay triangulation function.
+    constrained_delaunay : callable, optional
+        Constrained Delaunay triangulation function, taking the vertices and the segments to respect as pairs of vertex indices,
+        and returning the faces inside the outer segments, such as ``constrained_delaunay_triangle``.
+        If provided, it is used instead of the Delaunay triangulation and the faces are not culled by circumcentre.
 
     Returns
     -------
@@ -42,37 +56,134 @@ def boundary_triangulation(outer_boundary, inner_boundaries, polyline_features=[
         The Delaunay mesh.
 
     """
+    vertices = [pt for boundary in [outer_boundary] + inner_boundaries + polyline_features for pt in boundary] + point_features
+
+    if constrained_delaunay:
+        return constrained_boundary_triangulation(vertices, outer_boundary, inner_boundaries, polyline_features, constrained_delaunay)
+
     if not delaunay:
         delaunay = delaunay_from_points
 
     # generate planar Delaunay triangulation
-    vertices = [pt for boundary in [outer_boundary] + inner_boundaries + polyline_features for pt in boundary] + point_features
     faces = delaunay(vertices)
 
     delaunay_mesh = Mesh.from_vertices_and_faces(vertices, faces)
 
-    # delete false faces with aligned vertices
-    for fkey in list(delaunay_mesh.faces()):
-        a, b, c = [delaunay_mesh.vertex_coordinates(vkey) for vkey in delaunay_mesh.face_vertices(fkey)]
-        ab = subtract_vectors(b, a)
-        ac = subtract_vectors(c, a)
-        if length_vector(cross_vectors(ab, ac)) == 0:
-            delaunay_mesh.delete_face(fkey)
-
-    # delete faces outisde the borders
-    for fkey in list(delaunay_mesh.faces()):
-        centre = trimesh_face_circle(delaunay_mesh, fkey)[0]
-        if not is_point_in_polygon_xy(centre, outer_boundary) or any([is_point_in_polygon_xy(centre, inner_boundary) for inner_boundary in inner_boundaries]):
-            delaunay_mesh.delete_face(fkey)
-
-    # topological cut along the feature polylines through unwelding
-    vertex_map = {geometric_key(delaunay_mesh.vertex_coordinates(vkey)): vkey for vkey in delaunay_mesh.vertices()}
-    edges = [edge for polyline in polyline_features for edge in pairwise([vertex_map[geometric_key(point)] for point in polyline])]
-    mesh_unweld_edges(delaunay_mesh, edges)
+    if compas.IPY:
+        # delete false faces with aligned vertices
+        for fkey in list(delaunay_mesh.faces()):
+            a, b, c = [delaunay_mesh.vertex_coordinates(vkey) for vkey in delaunay_mesh.face_vertices(fkey)]
+            ab = subtract_vectors(b, a)
+            ac = subtract_vectors(c, a)
+            if length_vector(cross_vectors(ab, ac)) == 0:
+                delaunay_mesh.delete_face(fkey)
+
+        # delete faces outisde the borders
+        for fkey in list(delaunay_mesh.faces()):
+            centre = trimesh_face_circle(delaunay_mesh, fkey)[0]
+            if not is_point_in_polygon_xy(centre, outer_boundary) or any([is_point_in_polygon_xy(centre, inner_boundary) for inner_boundary in inner_boundaries]):
+                delaunay_mesh.delete_face(fkey)
+
+    else:
+        fkeys = list(delaunay_mesh.faces())
+        triangles = array([[delaunay_mesh.vertex_coordinates(vkey) for vkey in delaunay_mesh.face_vertices(fkey)] for fkey in fkeys], dtype=float).reshape((-1, 3, 3))
+
+        # false faces with aligned vertices
+        normals = cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        delete = (normals == 0).all(axis=1)
+
+        # faces outside the borders
+        keep = (~delete).nonzero()[0]
+        centres = circumcentres_numpy(triangles[keep])
+        outside = ~is_point_in_polygon_xy_numpy(centres, outer_boundary)
+        for inner_boundary in inner_boundaries:
+            outside |= is_point_in_polygon_xy_numpy(centres, inner_boundary)
+        delete[keep[outside]] = True
+
+        for i in delete.nonzero()[0]:
+            delaunay_mesh.delete_face(fkeys[i])
+
+    feature_cut(delaunay_mesh, polyline_features)
 
     return delaunay_mesh
 
 
+def constrained_boundary_triangulation(vertices, outer_boundary, inner_boundaries, polyline_features, constrained_delaunay):
+    """Triangulation between the boundaries with a constrained Delaunay triangulation function respecting the boundary and feature edges.
+    """
+    # boundary loops and feature polylines as segments of vertex indices
+    segments = []
+    start = 0
+    for boundary in [outer_boundary] + inner_boundaries:
+        indices = list(range(start, start + len(boundary)))
+        segments += list(pairwise(indices + indices[:1]))
+        start += len(boundary)
+    for polyline in polyline_features:
+        segments += list(pairwise(range(start, start + len(polyline))))
+        start += len(polyline)
+
+    faces = constrained_delaunay(vertices, segments)
+    delaunay_mesh = Mesh.from_vertices_and_faces(vertices, faces)
+
+    # delete faces in the holes of the inner boundaries, on either side of the segments
+    if inner_boundaries:
+        fkeys = list(delaunay_mesh.faces())
+        centroids = [centroid_points(delaunay_mesh.face_coordinates(fkey)) for fkey in fkeys]
+        if compas.IPY:
+            inside = [any([is_point_in_polygon_xy(centroid, inner_boundary) for inner_boundary in inner_boundaries]) for centroid in centroids]
+        else:
+            inside = is_point_in_polygon_xy_numpy(centroids, inner_boundaries[0])
+            for inner_boundary in inner_boundaries[1:]:
+                inside |= is_point_in_polygon_xy_numpy(centroids, inner_boundary)
+        for fkey, is_inside in zip(fkeys, inside):
+            if is_inside:
+                delaunay_mesh.delete_face(fkey)
+
+    feature_cut(delaunay_mesh, polyline_features)
+
+    return delaunay_mesh
+
+
+def feature_cut(mesh, polyline_features):
+    """Topological cut along the feature polylines through unwelding.
+    """
+    vertex_map = {geometric_key(mesh.vertex_coordinates(vkey)): vkey for vkey in mesh.vertices()}
+    edges = [edge for polyline in polyline_features for edge in pairwise([vertex_map[geometric_key(point)] for point in polyline])]
+    mesh_unweld_edges(mesh, edges)
+
+
+def constrained_delaunay_triangle(vertices, segments):
+    """Constrained Delaunay triangulation in the XY-plane with the optional Triangle package.
+    The triangles outside the outer segments are removed, but not the ones in holes.
+
+    Parameters
+    ----------
+    vertices : list
+        List of vertex coordinates.
+    segments : list
+        List of segments to respect as pairs of vertex indices.
+
+    Returns
+    -------
+    list
+        List of triangular faces as lists of vertex indices.
+
+    Raises
+    ------
+    ImportError
+        If Triangle is not installed.
+    ValueError
+        If the segments intersect, which would require new vertices.
+
+    """
+    import triangle
+
+    result = triangle.triangulate({'vertices': [xyz[:2] for xyz in vertices], 'segments': segments}, 'p')
+    if len(result['vertices']) != len(vertices):
+        raise ValueError('The segments intersect.')
+    return result['triangles'].tolist()
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
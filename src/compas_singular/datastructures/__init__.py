@@ -70,6 +70,8 @@ Core
     :nosignatures:
 
     QuadMesh
+    FrozenQuadMesh
+    StripGraph
 
 Morphing
 --------
@@ -95,6 +95,195 @@ class Lizard:
 			elif k == 'd':
 				self.delete()
 
+	def copy(self):
+		"""Copy the lizard and its mesh.
+
+		Returns
+		-------
+		Lizard
+			A lizard on a copy of the mesh, in the same state.
+
+		"""
+		lizard = Lizard(self.mesh.copy())
+		lizard.lizard = self.lizard[:] if self.lizard is not None else None
+		lizard.grow = self.grow
+		return lizard
+
+	def from_strings_to_rules(self, strings, func=None, processes=None):
+		"""Apply strings of rules from the current state of the lizard, which is not modified.
+
+		The strings are organised in a prefix tree so that shared prefixes are applied once.
+		The lizard and its mesh are only copied at branch points of the tree.
+		The strings whose rules or evaluation fail get None as result.
+
+		Parameters
+		----------
+		strings : list
+			A list of strings of rules.
+		func : callable, optional
+			A function evaluating a lizard after a string, without modifying it.
+			Default is None, to return the meshes.
+		processes : int, optional
+			A number of processes to evaluate chunks of the sorted strings in parallel.
+			The function must then be picklable.
+			Default is None, to evaluate sequentially.
+
+		Returns
+		-------
+		list
+			The results per string.
+
+		"""
+		if processes:
+			from multiprocessing import Pool
+
+			# contiguous chunks of the sorted strings, one per process, to keep the shared prefixes together
+			order = sorted(range(len(strings)), key=lambda i: strings[i])
+			size = max(1, -(-len(order) // processes))
+			groups = [order[k: k + size] for k in range(0, len(order), size)]
+
+			tasks = [(type(self.mesh), self.mesh.to_data(), self.lizard, self.grow, [strings[i] for i in indices], func) for indices in groups]
+			pool = Pool(processes)
+			try:
+				outputs = pool.map(rollout_strings, tasks)
+			finally:
+				pool.close()
+				pool.join()
+
+			results = [None] * len(strings)
+			for indices, output in zip(groups, outputs):
+				for i, result in zip(indices, output):
+					if func is None and result is not None:
+						result = type(self.mesh).from_data(result)
+					results[i] = result
+			return results
+
+		# prefix tree with string indices at the end nodes
+		trie = {}
+		for i, string in enumerate(strings):
+			node = trie
+			for k in string:
+				node = node.setdefault(k, {})
+			node.setdefault(None, []).append(i)
+
+		results = [None] * len(strings)
+		stack = [(self.copy(), trie)]
+		while stack:
+			lizard, node = stack.pop()
+			children = [k for k in node if k is not None]
+
+			ends = node.get(None, [])
+			for j, i in enumerate(ends):
+				if func is not None:
+					try:
+						results[i] = func(lizard)
+					except Exception:
+						results[i] = None
+				elif len(children) > 0 or j < len(ends) - 1:
+					results[i] = lizard.mesh.copy()
+				else:
+					results[i] = lizard.mesh
+
+			# copy at branch points, the last branch continues with the current lizard
+			branches = [lizard.copy() for k in children[:-1]] + [lizard]
+			for k, branch in zip(children, branches):
+				try:
+					branch.from_string_to_rules(k)
+				except Exception:
+					continue
+				stack.append((branch, node[k]))
+
+		return results
+
+	def from_vectors_to_metrics(self, vectors, processes=None, meshes=False):
+		"""Evaluate a population of vectors from the current state of the lizard, which is not modified.
+
+		Parameters
+		----------
+		vectors : list, array
+			A list of vectors or an array of shape (N, 2L), e.g. a NumPy array of genomes.
+		processes : int, optional
+			A number of processes to evaluate the vectors in parallel.
+			Default is None, to evaluate sequentially.
+		meshes : bool, optional
+			Whether to return the meshes as well.
+			Default is False, to only keep the metrics.
+
+		Returns
+		-------
+		dict
+			A table with lists of the number of strips, number of singularities, number of faces and validity per vector.
+			The lists of meshes, if requested.
+			Metrics are None and validity False for vectors whose rules or metrics fail.
+
+		"""
+		strings = [self.from_vector_to_string(vector) for vector in vectors]
+
+		if meshes:
+			results = self.from_strings_to_rules(strings, processes=processes)
+			metrics = []
+			for mesh in results:
+				try:
+					metrics.append(lizard_metrics(Lizard(mesh)) if mesh is not None else None)
+				except Exception:
+					metrics.append(None)
+		else:
+			metrics = self.from_strings_to_rules(strings, func=lizard_metrics, processes=processes)
+
+		table = {'strips': [], 'singularities': [], 'faces': [], 'valid': []}
+		for metric in metrics:
+			strips, singularities, faces, valid = metric if metric is not None else (None, None, None, False)
+			table['strips'].append(strips)
+			table['singularities'].append(singularities)
+			table['faces'].append(faces)
+			table['valid'].append(valid)
+		if meshes:
+			table['meshes'] = results
+		return table
+
+
+def lizard_metrics(lizard):
+	"""Compute the metrics of the mesh of a lizard.
+
+	Parameters
+	----------
+	lizard : Lizard
+		A lizard.
+
+	Returns
+	-------
+	tuple
+		The number of strips, number of singularities, number of faces and whether the mesh is a manifold quad mesh.
+
+	"""
+	mesh = lizard.mesh
+	valid = mesh.is_manifold() and all(len(mesh.face_vertices(fkey)) == 4 for fkey in mesh.faces())
+	return mesh.number_of_strips(), len(mesh.singularities()), mesh.number_of_faces(), valid
+
+
+def rollout_strings(args):
+	"""Apply strings of rules from a lizard state, in a separate process.
+
+	Parameters
+	----------
+	args : tuple
+		The mesh class, the mesh data, the lizard, the growth status, the strings and the evaluation function.
+
+	Returns
+	-------
+	list
+		The results per string, with mesh data instead of meshes if there is no evaluation function.
+
+	"""
+	cls, data, lizard, grow, strings, func = args
+	rollout = Lizard(cls.from_data(data))
+	rollout.lizard = lizard
+	rollout.grow = grow
+	results = rollout.from_strings_to_rules(strings, func)
+	if func is None:
+		results = [mesh.to_data() if mesh is not None else None for mesh in results]
+	return results
+
 			
 # ==============================================================================
 # Main
@@ -2,11 +2,17 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+import compas
+
 from .mesh_quad import *  # noqa: F401 F403
+from .strip_graph import *  # noqa: F401 F403
 from .coloring import *  # noqa: F401 F403
 from .grammar_pattern import *  # noqa: F401 F403
 from .grammar_shape import *  # noqa: F401 F403
 from .morphing import *  # noqa: F401 F403
 from .grammar import *  # noqa: F401 F403
 
+if not compas.IPY:
+    from .frozen_numpy import *  # noqa: F401 F403
+
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -0,0 +1,301 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from numpy import add
+from numpy import arange
+from numpy import array
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import flatnonzero
+from numpy import split
+from numpy import where
+from numpy import zeros
+
+
+__all__ = ['FrozenQuadMesh']
+
+
+class FrozenQuadMesh(object):
+    """FrozenQuadMesh class for an array-backed snapshot of a quad mesh, for read-heavy analysis.
+
+    The connectivity is stored in compressed sparse row arrays indexed by vertex position:
+    the neighbours of the vertex at position i are ``vv_idx[vv_ptr[i]: vv_ptr[i + 1]]``,
+    and its faces are ``vf_idx[vf_ptr[i]: vf_ptr[i + 1]]``.
+    The degree, boundary flag, topological index and singular flag of all the vertices are computed once, as arrays.
+    The pseudo-quad faces and their poles are taken into account if the mesh has face poles.
+
+    The polyedge arrays are only built at the first polyedge query, from the polyedges of the mesh then,
+    skipping the stale polyedges through vertices that are not in the snapshot.
+
+    The vertex coordinates are not stored but read from the mesh at each query, so they follow the vertex moves.
+    The connectivity and the poles are not updated with the mesh. Use ``QuadMesh.freeze`` to get the snapshot of the current mesh.
+
+    Parameters
+    ----------
+    mesh : QuadMesh
+        A quad mesh or pseudo-quad mesh.
+
+    Attributes
+    ----------
+    vertex_keys : list
+        The vertex keys per vertex position.
+    vertex_index : dict
+        The vertex positions per vertex key.
+    face_keys : list
+        The face keys per face position.
+    face_index : dict
+        The face positions per face key.
+    xyz : array
+        The current vertex coordinates as an array of shape (n, 3).
+    face_pole : dict
+        The face poles of the mesh when the snapshot was built.
+    vv_ptr, vv_idx : array
+        The vertex neighbours as compressed sparse rows of vertex positions, without the deleted vertices.
+    vf_ptr, vf_idx : array
+        The vertex faces as compressed sparse rows of face positions, without the deleted faces.
+    degree : array
+        The vertex degrees, counting the halfedges to deleted vertices as ``QuadMesh.vertex_degree``.
+    boundary : array
+        The vertex boundary flags.
+    pole : array
+        The vertex pole flags.
+    pseudo_quad : array
+        The face pseudo-quad flags.
+    topo_index : array
+        The vertex topological indices.
+    singular : array
+        The vertex singular flags.
+    polyedge_keys : list
+        The polyedge keys, built at the first polyedge query.
+    pe_ptr, pe_idx : array
+        The polyedges as compressed sparse rows of vertex positions, built at the first polyedge query.
+
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.vertex_keys = list(mesh.vertices())
+        self.vertex_index = {vkey: i for i, vkey in enumerate(self.vertex_keys)}
+        self.face_keys = list(mesh.faces())
+        self.face_index = {fkey: i for i, fkey in enumerate(self.face_keys)}
+
+        vertex_index, face_index = self.vertex_index, self.face_index
+        # the halfedges to deleted vertices or faces are counted in the degree, as in QuadMesh.vertex_degree, but not indexed
+        nbrs, faces, degree, boundary = [], [], [], []
+        for vkey in self.vertex_keys:
+            halfedges = mesh.halfedge[vkey]
+            nbrs.append([vertex_index[nbr] for nbr in halfedges if nbr in vertex_index])
+            faces.append([face_index[fkey] for fkey in halfedges.values() if fkey in face_index])
+            degree.append(len(halfedges))
+            boundary.append(None in halfedges.values())
+        self.vv_ptr, self.vv_idx = csr(nbrs)
+        self.vf_ptr, self.vf_idx = csr(faces)
+        self.degree = array(degree, dtype=int)
+        self.boundary = array(boundary, dtype=bool)
+
+        face_pole = self.face_pole = dict(mesh.attributes.get('face_pole') or {})
+        self.pseudo_quad = zeros(len(self.face_keys), dtype=bool)
+        self.pseudo_quad[[face_index[fkey] for fkey in face_pole if fkey in face_index]] = True
+        self.pole = zeros(len(self.vertex_keys), dtype=bool)
+        self.pole[[vertex_index[vkey] for vkey in set(face_pole.values()) if vkey in vertex_index]] = True
+
+        self.topo_index, self.singular = self.valency_analysis()
+
+        self._polyedges = None
+
+    @property
+    def xyz(self):
+        return asarray([self.mesh.vertex_coordinates(vkey) for vkey in self.vertex_keys], dtype=float).reshape((-1, 3))
+
+    @property
+    def polyedge_keys(self):
+        return self.polyedge_arrays()[0]
+
+    @property
+    def pe_ptr(self):
+        return self.polyedge_arrays()[1]
+
+    @property
+    def pe_idx(self):
+        return self.polyedge_arrays()[2]
+
+    def polyedge_arrays(self):
+        """Build the polyedge arrays at the first call, skipping the stale polyedges through vertices that are not in the snapshot.
+
+        Returns
+        -------
+        polyedge_keys : list
+            The polyedge keys.
+        pe_ptr, pe_idx : array
+            The polyedges as compressed sparse rows of vertex positions.
+
+        """
+        if self._polyedges is None:
+            vertex_index = self.vertex_index
+            keys, rows = [], []
+            for key, polyedge in self.mesh.attributes['polyedges'].items():
+                if all(vkey in vertex_index for vkey in polyedge):
+                    keys.append(key)
+                    rows.append([vertex_index[vkey] for vkey in polyedge])
+            ptr, idx = csr(rows)
+            self._polyedges = keys, ptr, idx
+        return self._polyedges
+
+    def valency_analysis(self):
+        """Compute the topological indices and the singular flags of all the vertices,
+        with the same rules as ``QuadMesh`` and ``PseudoQuadMesh``.
+
+        Returns
+        -------
+        topo_index : array
+            The vertex topological indices.
+        singular : array
+            The vertex singular flags.
+
+        """
+        regular = where(self.boundary, 3., 4.)
+        topo_index = (regular - self.degree) / 4.
+
+        if self.pole.any():
+            # quad faces per vertex, to adapt the valency of the poles
+            nb_faces = self.vf_ptr[1:] - self.vf_ptr[:-1]
+            rows = arange(len(nb_faces)).repeat(nb_faces)
+            quads = bincount(rows, weights=~self.pseudo_quad[self.vf_idx], minlength=len(nb_faces))
+            full = self.pole & (quads == 0)
+            partial = self.pole & (quads > 0)
+            topo_index[full] = where(self.boundary[full], .5, 1.)
+            topo_index[partial] = (regular[partial] - quads[partial] - self.boundary[partial]) / 4.
+
+        topo_index[self.degree == 0] = 0.
+        singular = self.pole | (self.degree != regular)
+        return topo_index, singular
+
+    # --------------------------------------------------------------------------
+    # queries
+    # --------------------------------------------------------------------------
+
+    def vertex_neighbors(self, vkey):
+        """Return the neighbours of a vertex.
+
+        Parameters
+        ----------
+        vkey : hashable
+            A vertex key.
+
+        Returns
+        -------
+        list
+            The neighbour vertex keys.
+
+        """
+        i = self.vertex_index[vkey]
+        return [self.vertex_keys[j] for j in self.vv_idx[self.vv_ptr[i]: self.vv_ptr[i + 1]]]
+
+    def vertex_faces(self, vkey):
+        """Return the faces of a vertex.
+
+        Parameters
+        ----------
+        vkey : hashable
+            A vertex key.
+
+        Returns
+        -------
+        list
+            The face keys.
+
+        """
+        i = self.vertex_index[vkey]
+        return [self.face_keys[j] for j in self.vf_idx[self.vf_ptr[i]: self.vf_ptr[i + 1]]]
+
+    def is_vertex_on_boundary(self, vkey):
+        return bool(self.boundary[self.vertex_index[vkey]])
+
+    def is_vertex_singular(self, vkey):
+        """Output whether a vertex is quad mesh singularity.
+
+        Parameters
+        ----------
+        vkey : hashable
+            A vertex key.
+
+        Returns
+        -------
+        bool
+            True if the vertex is a quad mesh singularity. False otherwise.
+
+        """
+        return bool(self.singular[self.vertex_index[vkey]])
+
+    def vertex_topo_index(self, vkey):
+        """Return the topological index of a vertex.
+
+        Parameters
+        ----------
+        vkey : hashable
+            A vertex key.
+
+        Returns
+        -------
+        float
+            The vertex topological index.
+
+        """
+        return float(self.topo_index[self.vertex_index[vkey]])
+
+    def singularities(self):
+        """Return the singular vertices.
+
+        Returns
+        -------
+        list
+            The singular vertex keys, in the vertex order of the mesh.
+
+        """
+        return [self.vertex_keys[i] for i in flatnonzero(self.singular)]
+
+    def polylines(self):
+        """Return the polylines of the polyedges, skipping the stale ones.
+
+        Returns
+        -------
+        list
+            The polylines as arrays of shape (n, 3), in the order of the polyedge keys.
+
+        """
+        if len(self.polyedge_keys) == 0:
+            return []
+        return split(self.xyz[self.pe_idx], self.pe_ptr[1:-1])
+
+    def polyedge_centroids(self):
+        """Return the centroids of the polyedge vertices, skipping the stale polyedges.
+
+        Returns
+        -------
+        array
+            The centroids as an array of shape (n, 3), in the order of the polyedge keys.
+
+        """
+        if len(self.polyedge_keys) == 0:
+            return zeros((0, 3))
+        lengths = self.pe_ptr[1:] - self.pe_ptr[:-1]
+        return add.reduceat(self.xyz[self.pe_idx], self.pe_ptr[:-1]) / lengths[:, None]
+
+
+def csr(rows):
+    """Compressed sparse row arrays of a list of lists of integers.
+    """
+    ptr = concatenate([[0], cumsum([len(row) for row in rows], dtype=int)]).astype(int)
+    indices = asarray([i for row in rows for i in row], dtype=int)
+    return ptr, indices
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
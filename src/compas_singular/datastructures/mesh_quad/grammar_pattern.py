@@ -2,6 +2,7 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+from collections import deque
 from math import pi
 
 from compas.datastructures import mesh_substitute_vertex_in_faces
@@ -12,7 +13,6 @@ from compas.geometry import centroid_points
 # from compas.geometry import project_point_line
 # from compas.topology import shortest_path
 # from compas.topology import connected_components
-from compas.topology import breadth_first_paths
 from compas.utilities import geometric_key
 from compas.utilities import pairwise
 
@@ -447,9 +447,13 @@ def strips_to_split_to_prevent_boundary_collapse(mesh, skeys):
     return to_split
 
 
-def split_strip(mesh, skey, n=2):
+def split_strip(mesh, skey, n=2, edge_strip=None):
     """Refine a strip in n strips.
 
+    The faces of the strip are subdivided in one pass by inserting n - 1 vertices on each strip edge,
+    followed by a single update of the strip data.
+    Strips crossing themselves or containing poles are refined by successive strip additions.
+
     Parameters
     ----------
     mesh : QuadMesh
@@ -459,6 +463,9 @@ def split_strip(mesh, skey, n=2):
     n : int
         The refinement value.
         Default value is two
+    edge_strip : dict, optional
+        A dictionary of edges pointing to their strip key, updated in place.
+        Computed if not provided.
 
     Returns
     -------
@@ -467,7 +474,63 @@ def split_strip(mesh, skey, n=2):
 
     """
 
-    return [skey] + [add_strip(mesh, mesh.strip_side_polyedges(skey)[0])[0] for i in range(n - 1)]
+    if n < 2:
+        return [skey]
+
+    strip_edges = mesh.strip_edges(skey)
+    strip_faces = mesh.strip_faces(skey)
+
+    # strips crossing themselves or with poles are not subdivided face by face
+    if len(set(strip_faces)) != len(strip_faces) or any(u == v for u, v in strip_edges) or any(len(mesh.face_vertices(fkey)) != 4 for fkey in strip_faces):
+        skeys = [skey] + [add_strip(mesh, mesh.strip_side_polyedges(skey)[0])[0] for i in range(n - 1)]
+        if edge_strip is not None:
+            edge_strip.clear()
+            edge_strip.update(strip_edge_map(mesh))
+        return skeys
+
+    if edge_strip is None:
+        edge_strip = strip_edge_map(mesh)
+
+    closed = mesh.is_strip_closed(skey)
+
+    # transverse strips along the sides of the strip faces
+    transverse_strips = set()
+    for (u0, v0), (u1, v1) in pairwise(strip_edges + strip_edges[:1] if closed else strip_edges):
+        transverse_strips.add(edge_strip[(u0, u1)])
+        transverse_strips.add(edge_strip[(v0, v1)])
+
+    # subdivide strip edges
+    edge_vertices = []
+    for u, v in strip_edges:
+        new_vertices = []
+        for k in range(1, n):
+            x, y, z = mesh.edge_point(u, v, float(k) / float(n))
+            new_vertices.append(mesh.add_vertex(attr_dict={'x': x, 'y': y, 'z': z}))
+        edge_vertices.append([u] + new_vertices + [v])
+
+    # subdivide strip faces
+    for i, fkey in enumerate(strip_faces):
+        a = edge_vertices[i]
+        b = edge_vertices[i + 1 - len(edge_vertices)]
+        mesh.delete_face(fkey)
+        for k in range(n):
+            mesh.add_face([a[k], a[k + 1], b[k + 1], b[k]])
+
+    # update strip data
+    skeys = [skey] + [max(mesh.attributes['strips']) + 1 + k for k in range(n - 1)]
+    for k, new_skey in enumerate(skeys):
+        edges = [(polyedge[k], polyedge[k + 1]) for polyedge in edge_vertices]
+        mesh.attributes['strips'][new_skey] = edges
+        for u, v in edges:
+            edge_strip[(u, v)] = edge_strip[(v, u)] = new_skey
+
+    for transverse_skey in transverse_strips:
+        edges = mesh.collect_strip(*mesh.strip_edges(transverse_skey)[0])
+        mesh.attributes['strips'][transverse_skey] = edges
+        for u, v in edges:
+            edge_strip[(u, v)] = edge_strip[(v, u)] = transverse_skey
+
+    return skeys
 
 
 def split_strips(mesh, skey_to_n):
@@ -487,12 +550,39 @@ def split_strips(mesh, skey_to_n):
 
     """
 
-    return {skey: split_strip(mesh, skey, n) for skey, n in skey_to_n.items()}
+    edge_strip = strip_edge_map(mesh)
+    return {skey: split_strip(mesh, skey, n, edge_strip) for skey, n in skey_to_n.items()}
+
+
+def strip_edge_map(mesh):
+    """Map the edges of a quad mesh, in both directions, to their strip key.
+
+    Parameters
+    ----------
+    mesh : QuadMesh
+        A quad mesh.
+
+    Returns
+    -------
+    dict
+        A dictionary of edges pointing to strip keys.
+
+    """
+
+    edge_strip = {}
+    for skey, edges in mesh.strips(data=True):
+        for u, v in edges:
+            edge_strip[(u, v)] = edge_strip[(v, u)] = skey
+    return edge_strip
 
 
 def strip_polyedge_update(mesh, polyedge, vertex_modifications):
     """Update a polyedge in mesh that has been modified.
 
+    The candidate vertices of each position along the polyedge form a layer.
+    The updated polyedge is the shortest path in the layered graph, i.e. a path through adjacent candidate vertices
+    that stays in the same layer or moves to the next one, found with a breadth-first search from each start vertex.
+
     Parameters
     ----------
     mesh : QuadMesh
@@ -504,8 +594,9 @@ def strip_polyedge_update(mesh, polyedge, vertex_modifications):
 
     Returns
     -------
-    shortest_polyedge: list
+    shortest_polyedge: list, None
         The updated polyedge as a list of vertex keys.
+        None if no valid polyedge was found.
 
     """
 
@@ -514,49 +605,47 @@ def strip_polyedge_update(mesh, polyedge, vertex_modifications):
     if closed:
         polyedge = polyedge[:-1]
 
-    # update polyedge with candidate vertices
-    polyedge_modifications = {vkey: (vertex_modifications[vkey] if vkey in vertex_modifications else [vkey]) for vkey in polyedge}
-    # list all candidate vertices to form new polyedge
-    candidate_vertices = tuple(set([vkey for vkeys in polyedge_modifications.values() for vkey in vkeys]))
-    # adjacency restricted to candidate vertices
-    adjacency = {vkey: [nbr for nbr in mesh.vertex_neighbors(vkey) if nbr in candidate_vertices] for vkey in mesh.vertices() if vkey in candidate_vertices}
+    # candidate vertices per position along the polyedge
+    layers = [vertex_modifications.get(vkey, [vkey]) for vkey in polyedge]
+    last = len(layers) - 1
 
-    # for each combination of boundary vertex extremities, get the shortest
-    # valid path through the modified vertices of the polyedges
     shortest_polyedge = None
-    # start vertices on boundary
-    for vkey_start in polyedge_modifications[polyedge[0]]:
-        if mesh.is_vertex_on_boundary(vkey_start):
-            # end vertices on boundary
-            for vkey_end in polyedge_modifications[polyedge[-1]]:
-                if mesh.is_vertex_on_boundary(vkey_end):
-                    # iterate through all paths between start and end vertices
-                    # starting by the shortest
-                    for candidate_polyedge in breadth_first_paths(adjacency, vkey_start, vkey_end):
-                        is_valid = True
-                        # if was initailly closed, make sure that temporary end
-                        # is adjacent to start
-                        if closed:
-                            if candidate_polyedge[0] not in mesh.vertex_neighbors(candidate_polyedge[-1]):
-                                continue
-                        # check that vertices in path come from the modified
-                        # vertices of the polyedge in the same order
-                        i = 0
-                        for vkey in candidate_polyedge:
-                            if vkey in polyedge_modifications[polyedge[i]]:
-                                continue
-                            elif vkey in polyedge_modifications[polyedge[i + 1]]:
-                                i += 1
-                            else:
-                                is_valid = False
-                                break
-                        # update if shorter
-                        if is_valid:
-                            if shortest_polyedge is None or len(shortest_polyedge) > len(candidate_polyedge):
-                                shortest_polyedge = candidate_polyedge
-                            break
+    for vkey_start in layers[0]:
+        # open polyedges run from boundary to boundary
+        if not closed and not mesh.is_vertex_on_boundary(vkey_start):
+            continue
 
-    if closed:
+        start = (0, vkey_start)
+        parent = {start: None}
+        queue = deque([start])
+        end = None
+        while queue:
+            i, vkey = queue.popleft()
+            # if was initially closed, the end must be adjacent to the start
+            if i == last:
+                if (closed and vkey_start in mesh.vertex_neighbors(vkey)) or (not closed and mesh.is_vertex_on_boundary(vkey)):
+                    end = (i, vkey)
+                    break
+            for nbr in mesh.vertex_neighbors(vkey):
+                for j in (i, i + 1):
+                    if j <= last and nbr in layers[j] and (j, nbr) not in parent:
+                        parent[(j, nbr)] = (i, vkey)
+                        queue.append((j, nbr))
+
+        if end is None:
+            continue
+
+        candidate_polyedge = []
+        while end is not None:
+            candidate_polyedge.append(end[1])
+            end = parent[end]
+        candidate_polyedge.reverse()
+
+        # update if shorter
+        if shortest_polyedge is None or len(shortest_polyedge) > len(candidate_polyedge):
+            shortest_polyedge = candidate_polyedge
+
+    if closed and shortest_polyedge is not None:
         shortest_polyedge.append(shortest_polyedge[0])
 
     return shortest_polyedge
@@ -5,6 +5,8 @@ from __future__ import division
 from math import floor
 from operator import itemgetter
 
+import compas
+
 from compas.geometry import centroid_points
 from compas.utilities import pairwise
 
@@ -12,6 +14,11 @@ from compas_singular.utilities import list_split
 
 from ..mesh import Mesh
 
+from .strip_graph import StripGraph
+
+if not compas.IPY:
+    from .frozen_numpy import FrozenQuadMesh
+
 
 __all__ = ['QuadMesh']
 
@@ -22,6 +29,10 @@ class QuadMesh(Mesh):
         super(QuadMesh, self).__init__()
         self.attributes['strips'] = {}
         self.attributes['polyedges'] = {}
+        self._frozen = None
+        self._strip_graph = None
+        self._vertex_polyedges = None
+        self._polyedges_modified = set()
 
     def strips(self, data=False):
 
@@ -32,12 +43,68 @@ class QuadMesh(Mesh):
                 yield skey
 
     def polyedges(self, data=False):
+        if self._polyedges_modified:
+            self.update_polyedges()
         for key in self.attributes['polyedges']:
             if data:
                 yield key, self.attributes['polyedges'][key]
             else:
                 yield key
 
+    # --------------------------------------------------------------------------
+    # frozen snapshot
+    # --------------------------------------------------------------------------
+
+    def add_vertex(self, *args, **kwargs):
+        self.unfreeze()
+        return super(QuadMesh, self).add_vertex(*args, **kwargs)
+
+    def add_face(self, *args, **kwargs):
+        self.unfreeze()
+        fkey = super(QuadMesh, self).add_face(*args, **kwargs)
+        if self._vertex_polyedges is not None and fkey is not None:
+            self._polyedges_modified.update(self.face[fkey])
+        return fkey
+
+    def delete_vertex(self, key):
+        self.unfreeze()
+        if self._vertex_polyedges is not None:
+            self._polyedges_modified.add(key)
+            self._polyedges_modified.update(self.halfedge[key])
+            for fkey in self.vertex_faces(key):
+                self._polyedges_modified.update(self.face[fkey])
+        return super(QuadMesh, self).delete_vertex(key)
+
+    def delete_face(self, fkey):
+        self.unfreeze()
+        if self._vertex_polyedges is not None:
+            self._polyedges_modified.update(self.face[fkey])
+        return super(QuadMesh, self).delete_face(fkey)
+
+    def freeze(self):
+        """Get an array-backed snapshot of the mesh for read-heavy analysis, built once and cached until the next edit
+        of the vertices, faces or face poles. The snapshot reads the current vertex coordinates.
+        Not available in IronPython.
+
+        Returns
+        -------
+        FrozenQuadMesh
+            The snapshot with the connectivity as compressed sparse rows, the vertex coordinates as an array
+            and the vectorized singularity queries.
+
+        """
+        if self._frozen is None or self._frozen.face_pole != (self.attributes.get('face_pole') or {}):
+            self._frozen = FrozenQuadMesh(self)
+        return self._frozen
+
+    def unfreeze(self):
+        """Clear the cached snapshot and strip graph of the mesh.
+        Done automatically when vertices or faces are added or deleted, or when the polyedges or strips are collected or updated.
+
+        """
+        self._frozen = None
+        self._strip_graph = None
+
     # --------------------------------------------------------------------------
     # opposite elements
     # --------------------------------------------------------------------------
@@ -87,11 +154,11 @@ class QuadMesh(Mesh):
 
         elif self.is_vertex_on_boundary(v):
 
-            if not self.is_vertex_on_boundary(u):
+            if not self.is_edge_on_boundary(u, v):
                 return None
 
             else:
-                return [nbr for nbr in self.vertex_neighbors(v) if nbr != u and self.is_vertex_on_boundary(nbr)][0]
+                return [nbr for nbr in self.vertex_neighbors(v) if nbr != u and self.is_edge_on_boundary(v, nbr)][0]
 
         else:
             nbrs = self.vertex_neighbors(v, ordered=True)
@@ -131,7 +198,57 @@ class QuadMesh(Mesh):
             The list of vertex indices that are quad mesh singularities.
 
         """
-        return [vkey for vkey in self.vertices() if self.is_vertex_singular(vkey)]
+        vkeys, _, _, _, singular = self.valency_analysis()
+        return [vkey for vkey, is_singular in zip(vkeys, singular) if is_singular]
+
+    def valency_analysis(self):
+        """Compute the degree, boundary flag, topological index and singular flag of all the vertices in one pass,
+        with the pole rules of the pseudo-quad meshes if the mesh has face poles.
+        Uses the frozen snapshot of the mesh outside IronPython. Only the connectivity and the poles are read, not the polyedge data.
+
+        Returns
+        -------
+        vkeys : list
+            The vertex keys.
+        degree : array or list
+            The vertex degrees.
+        boundary : array or list
+            The vertex boundary flags.
+        topo_index : array or list
+            The vertex topological indices.
+        singular : array or list
+            The vertex singular flags.
+
+        """
+        if not compas.IPY:
+            frozen = self.freeze()
+            return frozen.vertex_keys, frozen.degree, frozen.boundary, frozen.topo_index, frozen.singular
+
+        face_pole = self.attributes.get('face_pole') or {}
+        poles = set(face_pole.values())
+
+        vkeys, degree, boundary, topo_index, singular = [], [], [], [], []
+        for vkey in self.vertices():
+            halfedges = self.halfedge[vkey]
+            d = len(halfedges)
+            is_boundary = None in halfedges.values()
+            regular = 3. if is_boundary else 4.
+            if d == 0:
+                index = 0.
+            elif vkey in poles:
+                quads = len([fkey for fkey in halfedges.values() if fkey is not None and fkey not in face_pole])
+                if quads == 0:
+                    index = .5 if is_boundary else 1.
+                else:
+                    index = (regular - quads - is_boundary) / 4.
+            else:
+                index = (regular - d) / 4.
+            vkeys.append(vkey)
+            degree.append(d)
+            boundary.append(is_boundary)
+            topo_index.append(index)
+            singular.append(vkey in poles or d != regular)
+        return vkeys, degree, boundary, topo_index, singular
 
     def vertex_topo_index(self, vkey):
         """Compute vertex index.
@@ -176,8 +293,9 @@ class QuadMesh(Mesh):
         """
 
         polyedge = [u0, v0]
+        nb_vertices = len(self.vertex)
 
-        while len(polyedge) <= self.number_of_vertices():
+        while len(polyedge) <= nb_vertices:
 
             # end if closed loop
             if polyedge[0] == polyedge[-1]:
@@ -212,26 +330,161 @@ class QuadMesh(Mesh):
 
         """
 
-        edges = list(self.edges())
+        self.unfreeze()
+        self.attributes['polyedges'] = {}
+        collected = set()
 
         nb_polyedges = -1
-        while len(edges) > 0:
+        for u0, v0 in reversed(list(self.edges())):
+            if (u0, v0) in collected:
+                continue
             nb_polyedges += 1
 
             # collect new polyedge
-            u0, v0 = edges.pop()
             polyedge = self.collect_polyedge(u0, v0)
             self.attributes['polyedges'].update({nb_polyedges: polyedge})
 
-            # remove collected edges
+            # mark collected edges
             for u, v in pairwise(polyedge):
-                if (u, v) in edges:
-                    edges.remove((u, v))
-                elif (v, u) in edges:
-                    edges.remove((v, u))
+                collected.add((u, v))
+                collected.add((v, u))
+
+        self._polyedges_modified = set()
+        self._vertex_polyedges = None
+        self.vertex_polyedges_index()
 
         return self.polyedges(data=True)
 
+    def vertex_polyedges_index(self):
+        """Get the index of the polyedges passing through each vertex, built once from the stored polyedges
+        and kept up to date by ``collect_polyedges`` and ``update_polyedges``.
+        Once built, the vertices of the faces added or deleted are recorded to update the polyedges locally.
+
+        Returns
+        -------
+        dict
+            A dictionary of vertex keys pointing to the set of keys of the polyedges passing through them.
+
+        """
+        if self._vertex_polyedges is None or self._vertex_polyedges[0] is not self.attributes['polyedges']:
+            index = {}
+            for pkey, polyedge in self.attributes['polyedges'].items():
+                for vkey in polyedge:
+                    index.setdefault(vkey, set()).add(pkey)
+            self._vertex_polyedges = (self.attributes['polyedges'], index)
+        return self._vertex_polyedges[1]
+
+    def update_polyedges(self):
+        """Update the stored polyedges after adding or deleting faces or vertices, only re-collecting the polyedges passing through
+        the vertices of the modified faces. Done automatically when iterating over the polyedges, for instance after grammar operations.
+        The updated polyedges get new keys. If the modifications were not recorded, all the polyedges are collected again.
+
+        Returns
+        -------
+        list
+            The keys of the updated polyedges.
+
+        """
+        if not self.attributes['polyedges']:
+            self._polyedges_modified = set()
+            return []
+        if self._vertex_polyedges is None:
+            self.collect_polyedges()
+            return list(self.attributes['polyedges'].keys())
+
+        self.unfreeze()
+        polyedges = self.attributes['polyedges']
+        index = self.vertex_polyedges_index()
+        modified = self._polyedges_modified
+        self._polyedges_modified = set()
+
+        # remove the polyedges through modified vertices and keep their edges to collect again
+        stale = set([pkey for vkey in modified for pkey in index.get(vkey, [])])
+        edges = []
+        for pkey in stale:
+            polyedge = polyedges.pop(pkey)
+            edges += list(pairwise(polyedge))
+            for vkey in set(polyedge):
+                index[vkey].discard(pkey)
+                if not index[vkey]:
+                    del index[vkey]
+        edges += [(u, v) for u in modified if u in self.halfedge for v in self.halfedge[u]]
+
+        # collect the polyedges of the edges that still exist
+        collected = set()
+        new_pkeys = []
+        pkey = max(list(polyedges.keys()) + [-1])
+        for u0, v0 in edges:
+            if (u0, v0) in collected or u0 not in self.halfedge or v0 not in self.halfedge[u0]:
+                continue
+            pkey += 1
+            polyedge = self.collect_polyedge(u0, v0)
+            polyedges[pkey] = polyedge
+            new_pkeys.append(pkey)
+            for vkey in polyedge:
+                index.setdefault(vkey, set()).add(pkey)
+            for u, v in pairwise(polyedge):
+                collected.add((u, v))
+                collected.add((v, u))
+
+        return new_pkeys
+
+    def check_polyedges(self):
+        """Check that the stored polyedges, after the pending updates, are the ones collected from the current mesh,
+        regardless of their keys, orientation and start for the closed ones.
+
+        Returns
+        -------
+        bool
+            True if the stored polyedges are consistent with the mesh. False otherwise.
+
+        Raises
+        ------
+        ValueError
+            If the mesh is degenerate, with faces with repeated vertices, faces with the same vertices,
+            vertices whose faces do not form a single fan, or polyedges running through an edge twice,
+            for which the polyedges cannot be collected consistently.
+
+        """
+        faces = {}
+        for fkey in self.faces():
+            vertices = self.face_vertices(fkey)
+            if len(set(vertices)) != len(vertices):
+                raise ValueError('Degenerate mesh: the face {} has repeated vertices.'.format(fkey))
+            faces.setdefault(frozenset(vertices), []).append(fkey)
+        for fkeys in faces.values():
+            if len(fkeys) > 1:
+                raise ValueError('Degenerate mesh: the faces {} have the same vertices.'.format(fkeys))
+        for vkey in self.vertices():
+            if sorted(self.vertex_neighbors(vkey, ordered=True)) != sorted(self.vertex_neighbors(vkey)):
+                raise ValueError('Degenerate mesh: the faces of the vertex {} do not form a single fan.'.format(vkey))
+
+        if self._polyedges_modified:
+            self.update_polyedges()
+
+        def canonical(polyedge):
+            if polyedge[0] != polyedge[-1]:
+                return min(tuple(polyedge), tuple(reversed(polyedge)))
+            loop = polyedge[:-1]
+            return min(tuple(cycle[i:] + cycle[:i]) for cycle in [loop, loop[::-1]] for i in range(len(cycle)))
+
+        collected = set()
+        fresh = []
+        for u0, v0 in self.edges():
+            if (u0, v0) in collected:
+                continue
+            polyedge = self.collect_polyedge(u0, v0)
+            edges = set([frozenset(edge) for edge in pairwise(polyedge)])
+            if len(edges) < len(polyedge) - 1:
+                raise ValueError('Degenerate mesh: the polyedge of the edge {} runs through an edge twice.'.format((u0, v0)))
+            fresh.append(canonical(polyedge))
+            for u, v in pairwise(polyedge):
+                collected.add((u, v))
+                collected.add((v, u))
+
+        stored = [canonical(polyedge) for polyedge in self.attributes['polyedges'].values()]
+        return sorted(stored) == sorted(fresh)
+
     def is_polyedge_closed(self, pkey):
         """Output whether a polyedge is closed.
 
@@ -258,16 +511,14 @@ class QuadMesh(Mesh):
 
         """
 
-        # keep only polyedges connected to singularities or along the boundary
-        polyedges = [polyedge for key, polyedge in self.polyedges(data=True) if self.is_vertex_singular(
-            polyedge[0]) or self.is_vertex_singular(polyedge[-1]) or self.is_edge_on_boundary(polyedge[0], polyedge[1])]
+        singularities = set(self.singularities())
 
-        # get intersections between polyedges for split
-        vertices = [vkey for polyedge in polyedges for vkey in set(polyedge)]
-        split_vertices = [vkey for vkey in self.vertices() if vertices.count(vkey) > 1]
+        # keep only polyedges connected to singularities or along the boundary
+        polyedges = [polyedge for key, polyedge in self.polyedges(data=True) if polyedge[0] in singularities
+                     or polyedge[-1] in singularities or self.is_edge_on_boundary(polyedge[0], polyedge[1])]
 
-        # split singularity polyedges
-        return [split_polyedge for polyedge in polyedges for split_polyedge in list_split(polyedge, [polyedge.index(vkey) for vkey in split_vertices if vkey in polyedge])]
+        # split singularity polyedges at their intersections
+        return self.split_polyedges(polyedges)
 
     def singularity_polyedge_decomposition(self):
         """Returns a quad patch decomposition of the mesh based on the singularity polyedges, including boundaries and additionnal splits on the boundaries.
@@ -281,11 +532,14 @@ class QuadMesh(Mesh):
         if self.attributes['polyedges'] == {}:
             self.collect_polyedges()
 
-        polyedges = [polyedge for key, polyedge in self.polyedges(data=True) if (self.is_vertex_singular(
-            polyedge[0]) or self.is_vertex_singular(polyedge[-1])) and not self.is_edge_on_boundary(polyedge[0], polyedge[1])]
+        singularities = self.singularities()
+        singular = set(singularities)
+
+        polyedges = [polyedge for key, polyedge in self.polyedges(data=True) if (polyedge[0] in singular
+                     or polyedge[-1] in singular) and not self.is_edge_on_boundary(polyedge[0], polyedge[1])]
 
         # split boundaries
-        all_splits = list(set([vkey for polyedge in polyedges for vkey in polyedge] + self.singularities()))
+        all_splits = set([vkey for polyedge in polyedges for vkey in polyedge] + singularities)
 
         for boundary in self.boundaries():
             splits = [vkey for vkey in boundary if vkey in all_splits]
@@ -308,20 +562,43 @@ class QuadMesh(Mesh):
                     if not self.is_edge_on_boundary(vkey, nbr):
                         new_polyedge = self.collect_polyedge(vkey, nbr)
                         polyedges.append(new_polyedge)
-                        all_splits = list(set(all_splits + new_polyedge))
+                        all_splits.update(new_polyedge)
                         break
 
         # add boundaries
         polyedges += [polyedge for key, polyedge in self.polyedges(data=True) if self.is_edge_on_boundary(polyedge[0], polyedge[1])]
 
-        # get intersections between polyedges for split
-        vertices = [vkey for polyedge in polyedges for vkey in set(polyedge)]
-        split_vertices = [vkey for vkey in self.vertices() if vertices.count(vkey) > 1]
+        # split polyedges at their intersections
+        return self.split_polyedges(polyedges)
+
+    def split_polyedges(self, polyedges):
+        """Split polyedges at the vertices shared by several of them, counting the polyedges per vertex in one pass.
+
+        Parameters
+        ----------
+        polyedges : list
+            The polyedges as lists of vertex keys.
+
+        Returns
+        -------
+        list
+            The split polyedges.
 
-        # split singularity polyedges
-        return [
-            split_polyedge for polyedge in polyedges
-            for split_polyedge in list_split(polyedge, [polyedge.index(vkey) for vkey in split_vertices if vkey in polyedge])]
+        """
+        count = {}
+        for polyedge in polyedges:
+            for vkey in set(polyedge):
+                count[vkey] = count.get(vkey, 0) + 1
+
+        split_polyedges = []
+        for polyedge in polyedges:
+            # index of the first occurrence of each split vertex
+            indices = {}
+            for i, vkey in enumerate(polyedge):
+                if count[vkey] > 1 and vkey not in indices:
+                    indices[vkey] = i
+            split_polyedges += list_split(polyedge, list(indices.values()))
+        return split_polyedges
 
     # --------------------------------------------------------------------------
     # polylines
@@ -331,7 +608,7 @@ class QuadMesh(Mesh):
         """Compute the vertices and edges of the graph representing the polyedge connectivity,
         where each graph vertex is a mesh polyedge and each graph edge a non-compas_singular mesh vertex representing the crossing of two polyedges.
         Polyedges connected by their extremities, which are singularities, do not count as overlapping.
-        Potentially includes loop edges (u, u) or multiple arallel edges (u, v) and/or (v, u).
+        Potentially includes loop edges (u, u), for polyedges crossing themselves, or multiple parallel edges (u, v) and/or (v, u).
 
         Returns
         -------
@@ -339,15 +616,23 @@ class QuadMesh(Mesh):
             A tuple of two objects, the dictionary of mesh polyedge indices pointing to their centroid coordinates, and the list of edges between graph vertices.
         """
 
-        vertices = {key: centroid_points([self.vertex_coordinates(vkey) for vkey in polyedge]) for key, polyedge in self.polyedges(data=True)}
+        polyedges = list(self.polyedges(data=True))
+
+        if not compas.IPY and len(polyedges) > 0:
+            frozen = self.freeze()
+            vertices = dict(zip(frozen.polyedge_keys, frozen.polyedge_centroids().tolist()))
+        else:
+            vertices = {key: centroid_points([self.vertex_coordinates(vkey) for vkey in polyedge]) for key, polyedge in polyedges}
+
+        # crossing polyedges from the index of the polyedges through each vertex
+        singularities = set(self.singularities())
+        index = self.vertex_polyedges_index()
         edges = []
-        for key, polyedge in self.polyedges(data=True):
+        for key, polyedge in polyedges:
             for vkey in polyedge:
-                if not self.is_vertex_singular(vkey):
-                    for key_2, polyedge_2 in self.polyedges(data=True):
-                        if vkey in polyedge_2:
-                            edges.append((key, key_2))
-                            break
+                if vkey not in singularities:
+                    others = [key_2 for key_2 in index[vkey] if key_2 != key]
+                    edges += [(key, key_2) for key_2 in others] if others else [(key, key)]
         return vertices, edges
 
     # --------------------------------------------------------------------------
@@ -445,6 +730,7 @@ class QuadMesh(Mesh):
             The strip data.
         """
 
+        self.unfreeze()
         edges = [(u, v) if self.halfedge[u][v] is not None else (v, u) for u, v in self.edges()]
 
         nb_strip = -1
@@ -529,6 +815,21 @@ class QuadMesh(Mesh):
 
         return [self.halfedge[u][v] for u, v in self.strip_edges(skey) if self.halfedge[u][v] is not None]
 
+    def face_strip_edges(self, fkey):
+        """Return two consecutive edges of a face, one in each strip of the face.
+
+        Parameters
+        ----------
+        fkey : hashable
+
+        Returns
+        -------
+        list
+            The two edges.
+        """
+
+        return list(self.face_halfedges(fkey))[:2]
+
     def face_strips(self, fkey):
         """Return the two strips of a face.
 
@@ -542,7 +843,7 @@ class QuadMesh(Mesh):
             The two strips of the face.
         """
 
-        return [self.edge_strip((u, v)) for u, v in list(self.face_halfedges(fkey))[:2]]
+        return [self.edge_strip(edge) for edge in self.face_strip_edges(fkey)]
 
     # --------------------------------------------------------------------------
     # strip data operations
@@ -562,6 +863,7 @@ class QuadMesh(Mesh):
 
         """
 
+        self.unfreeze()
         if strips is None:
             strips = list(self.strips())
         self.attributes['strips'].update({skey: [tuple([new_vkey if vkey == old_vkey else vkey for vkey in list(edge)])
@@ -579,6 +881,7 @@ class QuadMesh(Mesh):
 
         """
 
+        self.unfreeze()
         self.attributes['strips'] = {skey: [(u, v) for u, v in self.strip_edges(skey) if self.halfedge[u][v] != fkey] for skey in self.strips()}
 
     # --------------------------------------------------------------------------
@@ -597,10 +900,23 @@ class QuadMesh(Mesh):
             and the list of edges between graph vertices.
         """
 
-        vertices = {skey: centroid_points(self.strip_edge_midpoint_polyline(skey) if not self.is_strip_closed(skey)
-                                          else self.strip_edge_midpoint_polyline(skey)[:-1]) for skey in self.strips()}
-        edges = [tuple(self.face_strips(fkey)) for fkey in self.faces()]
-        return vertices, edges
+        graph = self.compact_strip_graph()
+        vertices = dict(zip(graph.strip_keys, graph.coordinates()))
+        return vertices, graph.edges()
+
+    def compact_strip_graph(self):
+        """Get the graph of the strip connectivity with integer node ids and compressed sparse row adjacency,
+        built in one pass over the faces and cached until the next edit.
+
+        Returns
+        -------
+        StripGraph
+            The strip graph, with the closed strip flags and the node coordinates computed on request.
+        """
+
+        if self._strip_graph is None:
+            self._strip_graph = StripGraph(self)
+        return self._strip_graph
 
     # --------------------------------------------------------------------------
     # strip polyedges
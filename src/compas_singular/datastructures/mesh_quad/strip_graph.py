@@ -0,0 +1,152 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from compas.geometry import centroid_points
+
+
+__all__ = ['StripGraph']
+
+
+class StripGraph(object):
+    """StripGraph class for a compact graph of the strip connectivity of a quad mesh, for repeated analysis.
+
+    Each node is a strip, with an integer node id, and each face is an edge between the two strips crossing at the face,
+    potentially a loop if a strip crosses itself.
+    The adjacency is stored in compressed sparse row lists with multiplicities:
+    the neighbours of the node i are ``nbrs[ptr[i]: ptr[i + 1]]``, sorted,
+    crossing the node i in ``multiplicity[ptr[i]: ptr[i + 1]]`` faces.
+    The node coordinates, the centroids of the strip edge midpoints, are only computed when requested, from the current vertex coordinates.
+    The faces with an edge in none of the stored strips, before the strips are collected or after edits, are skipped.
+
+    The connectivity is not updated with the mesh. Use ``QuadMesh.compact_strip_graph`` to get the one of the current mesh.
+
+    Parameters
+    ----------
+    mesh : QuadMesh
+        A quad mesh or pseudo-quad mesh, with collected strips.
+
+    Attributes
+    ----------
+    strip_keys : list
+        The strip keys per node id.
+    strip_index : dict
+        The node ids per strip key.
+    closed : list
+        The closed strip flags per node id.
+    face_keys : list
+        The face keys per graph edge, without the faces with an edge in none of the strips.
+    face_nodes : list
+        The pairs of node ids per graph edge, in the order of the face keys.
+    ptr, nbrs, multiplicity : list
+        The adjacency as compressed sparse rows of node ids with multiplicities.
+
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.strip_keys = list(mesh.strips())
+        self.strip_index = {skey: i for i, skey in enumerate(self.strip_keys)}
+        self.closed = [mesh.is_strip_closed(skey) for skey in self.strip_keys]
+
+        # node id per edge, the first strip wins as with QuadMesh.edge_strip
+        edge_node = {}
+        for i, skey in enumerate(self.strip_keys):
+            for u, v in mesh.strip_edges(skey):
+                edge_node.setdefault((u, v), i)
+                edge_node.setdefault((v, u), i)
+
+        self.face_keys, self.face_nodes = [], []
+        for fkey in mesh.faces():
+            nodes = tuple(edge_node.get(edge) for edge in mesh.face_strip_edges(fkey))
+            if None not in nodes:
+                self.face_keys.append(fkey)
+                self.face_nodes.append(nodes)
+
+        count = [{} for i in range(len(self.strip_keys))]
+        for i, j in self.face_nodes:
+            count[i][j] = count[i].get(j, 0) + 1
+            if i != j:
+                count[j][i] = count[j].get(i, 0) + 1
+
+        self.ptr, self.nbrs, self.multiplicity = [0], [], []
+        for row in count:
+            for j in sorted(row):
+                self.nbrs.append(j)
+                self.multiplicity.append(row[j])
+            self.ptr.append(len(self.nbrs))
+
+    def number_of_nodes(self):
+        """Count the number of nodes, i.e. strips."""
+        return len(self.strip_keys)
+
+    def number_of_edges(self):
+        """Count the number of edges, i.e. faces crossed by two stored strips."""
+        return len(self.face_nodes)
+
+    def neighbors(self, i):
+        """Return the neighbours of a node.
+
+        Parameters
+        ----------
+        i : int
+            A node id.
+
+        Returns
+        -------
+        list
+            The sorted neighbour node ids, including the node itself if the strip crosses itself.
+
+        """
+        return self.nbrs[self.ptr[i]: self.ptr[i + 1]]
+
+    def multiplicities(self, i):
+        """Return the number of crossings of a node with its neighbours.
+
+        Parameters
+        ----------
+        i : int
+            A node id.
+
+        Returns
+        -------
+        list
+            The numbers of faces, in the order of the neighbours.
+
+        """
+        return self.multiplicity[self.ptr[i]: self.ptr[i + 1]]
+
+    def edges(self):
+        """Return the graph edges as pairs of strip keys, one per face.
+
+        Returns
+        -------
+        list
+            The pairs of strip keys, in the order of the faces.
+
+        """
+        keys = self.strip_keys
+        return [(keys[i], keys[j]) for i, j in self.face_nodes]
+
+    def coordinates(self):
+        """Return the node coordinates, the centroids of the strip edge midpoints, from the current vertex coordinates.
+
+        Returns
+        -------
+        list
+            The node coordinates per node id.
+
+        """
+        xyz = []
+        for skey, closed in zip(self.strip_keys, self.closed):
+            polyline = self.mesh.strip_edge_midpoint_polyline(skey)
+            xyz.append(centroid_points(polyline[:-1] if closed else polyline))
+        return xyz
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
@@ -2,20 +2,22 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
-from copy import deepcopy
 from math import floor
 from math import ceil
 
+import compas
+
 from compas.datastructures import meshes_join_and_weld
-from compas.topology import adjacency_from_edges
 from compas.topology import connected_components
 from compas.geometry import discrete_coons_patch
 from compas.geometry import vector_average
 from compas.utilities import pairwise
 
-from ..mesh import Mesh
 from ..mesh_quad import QuadMesh
 
+if not compas.IPY:
+    from compas_singular.geometry import discrete_coons_patch_numpy
+
 
 __all__ = ['CoarseQuadMesh']
 
@@ -53,21 +55,24 @@ class CoarseQuadMesh(QuadMesh):
         polyedges = quad_mesh.singularity_polyedge_decomposition()
 
         # vertex data
-        vertices = {vkey: quad_mesh.vertex_coordinates(vkey) for vkey in quad_mesh.vertices()}
         coarse_vertices_children = {vkey: vkey for polyedge in polyedges for vkey in [polyedge[0], polyedge[-1]]}
         coarse_vertices = {vkey: quad_mesh.vertex_coordinates(vkey) for vkey in coarse_vertices_children}
 
         # edge data
         coarse_edges_children = {(polyedge[0], polyedge[-1]): polyedge for polyedge in polyedges}
-        singularity_edges = [(x, y) for polyedge in polyedges for u, v in pairwise(polyedge) for x, y in [(u, v), (v, u)]]
+        singularity_edges = set([(x, y) for polyedge in polyedges for u, v in pairwise(polyedge) for x, y in [(u, v), (v, u)]])
+
+        # face data: patches of faces connected accross non-singularity edges
+        adjacency = {fkey: [] for fkey in quad_mesh.faces()}
+        for fkey in adjacency:
+            for u, v in quad_mesh.face_halfedges(fkey):
+                nbr = quad_mesh.halfedge[v][u]
+                if nbr is not None and (u, v) not in singularity_edges:
+                    adjacency[fkey].append(nbr)
 
-        # face data
-        faces = {fkey: quad_mesh.face_vertices(fkey) for fkey in quad_mesh.faces()}
-        adj_edges = {(f1, f2) for f1 in quad_mesh.faces() for f2 in quad_mesh.face_neighbors(f1) if f1 < f2 and quad_mesh.face_adjacency_halfedge(f1, f2) not in singularity_edges}
         coarse_faces_children = {}
-        for i, connected_faces in enumerate(connected_components(adjacency_from_edges(adj_edges))):
-            mesh = Mesh.from_vertices_and_faces(vertices, [faces[face] for face in connected_faces])
-            coarse_faces_children[i] = [vkey for vkey in reversed(mesh.boundaries()[0]) if mesh.vertex_degree(vkey) == 2]
+        for i, connected_faces in enumerate(connected_components(adjacency)):
+            coarse_faces_children[i] = patch_corners(quad_mesh, connected_faces)
 
         coarse_quad_mesh = cls.from_vertices_and_faces(coarse_vertices, coarse_faces_children)
 
@@ -92,9 +97,9 @@ class CoarseQuadMesh(QuadMesh):
                 d = len(coarse_edges_children.get((u, v), coarse_edges_children.get((v, u), [])))
                 coarse_quad_mesh.set_strip_density(skey, d)
 
-        # store quad mesh and use as polygonal mesh
+        # store quad mesh and a copy as polygonal mesh
         coarse_quad_mesh.set_quad_mesh(quad_mesh)
-        coarse_quad_mesh.set_polygonal_mesh(deepcopy(quad_mesh))
+        coarse_quad_mesh.set_polygonal_mesh(quad_mesh.copy())
 
         return coarse_quad_mesh
 
@@ -264,7 +269,10 @@ class CoarseQuadMesh(QuadMesh):
         for fkey in self.faces():
             ab, bc, cd, da = [[self.edge_point(u, v, float(i) / float(self.get_strip_density(edge_strip[(u, v)])))
                                for i in range(0, self.get_strip_density(edge_strip[(u, v)]) + 1)] for u, v in self.face_halfedges(fkey)]
-            vertices, faces = discrete_coons_patch(ab, bc, list(reversed(cd)), list(reversed(da)))
+            if compas.IPY:
+                vertices, faces = discrete_coons_patch(ab, bc, list(reversed(cd)), list(reversed(da)))
+            else:
+                vertices, faces = [array.tolist() for array in discrete_coons_patch_numpy(ab, bc, cd[::-1], da[::-1])]
             face_meshes[fkey] = QuadMesh.from_vertices_and_faces(vertices, faces)
 
         self.set_quad_mesh(meshes_join_and_weld(list(face_meshes.values())))
@@ -355,6 +363,43 @@ class CoarseQuadMesh(QuadMesh):
     # 	return self.quad_mesh
 
 
+def patch_corners(quad_mesh, fkeys):
+    """Walk the boundary of a patch of faces and return its corners, which are the boundary vertices of only one patch face.
+
+    Parameters
+    ----------
+    quad_mesh : QuadMesh
+        A quad mesh.
+    fkeys : list
+        The keys of the patch faces.
+
+    Returns
+    -------
+    list
+        The patch corners, in the orientation of the faces.
+
+    """
+    fkeys = set(fkeys)
+    count = {}
+    boundary = {}
+    for fkey in fkeys:
+        for u, v in quad_mesh.face_halfedges(fkey):
+            count[u] = count.get(u, 0) + 1
+            if quad_mesh.halfedge[v][u] not in fkeys:
+                boundary[u] = v
+
+    start = next((vkey for vkey in boundary if count[vkey] == 1), None)
+    if start is None:
+        return []
+    corners = [start]
+    vkey = boundary[start]
+    while vkey != start:
+        if count[vkey] == 1:
+            corners.append(vkey)
+        vkey = boundary[vkey]
+    return corners
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
@@ -7,7 +7,6 @@ from ast import literal_eval
 from compas.utilities import geometric_key
 
 from ..mesh_quad import QuadMesh
-from compas_singular.utilities import list_split
 
 import compas
 from distutils.version import LooseVersion
@@ -103,7 +102,7 @@ class PseudoQuadMesh(QuadMesh):
 
         data_face_pole = {}
         for fkey, vkey in iter(attributes['face_pole'].items()):
-            data_face_pole[literal_eval(fkey)] = vkey
+            data_face_pole[literal_eval(fkey) if isinstance(fkey, str) else fkey] = vkey
         self.attributes['face_pole'] = data_face_pole
 
     @classmethod
@@ -232,6 +231,7 @@ class PseudoQuadMesh(QuadMesh):
 
         """
 
+        self.unfreeze()
         edges = [(u, v) if self.halfedge[u][v] is not None else (v, u) for u, v in self.edges()]
 
         nb_strip = -1
@@ -358,8 +358,8 @@ class PseudoQuadMesh(QuadMesh):
                     faces.append(self.halfedge[u][v])
         return faces
 
-    def face_strips(self, fkey):
-        """Return the two strips of a face.
+    def face_strip_edges(self, fkey):
+        """Return two consecutive edges of a face, one in each strip of the face, starting from the pole of a pseudo-quad face.
 
         Parameters
         ----------
@@ -368,17 +368,16 @@ class PseudoQuadMesh(QuadMesh):
         Returns
         -------
         list
-            The two strips of the face.
+            The two edges.
         """
 
         if self.is_face_pseudo_quad(fkey):
             pole = self.attributes['face_pole'][fkey]
-            # print(pole, fkey, self.face_vertices(fkey))
             u = self.face_vertex_descendant(fkey, pole)
             v = self.face_vertex_descendant(fkey, u)
-            return [self.edge_strip((pole, u)), self.edge_strip((u, v))]
+            return [(pole, u), (u, v)]
         else:
-            return [self.edge_strip((u, v)) for u, v in list(self.face_halfedges(fkey))[:2]]
+            return list(self.face_halfedges(fkey))[:2]
 
     def delete_face_in_strips(self, fkey):
         """Delete face in strips.
@@ -392,6 +391,7 @@ class PseudoQuadMesh(QuadMesh):
 
         """
 
+        self.unfreeze()
         self.attributes['strips'] = {skey: [(u, v) for u, v in self.strip_edges(skey) if u == v or (
             self.halfedge[u][v] != fkey and self.halfedge[v][u] != fkey)] for skey in self.strips()}
 
@@ -405,20 +405,16 @@ class PseudoQuadMesh(QuadMesh):
 
         """
 
-        # poles = set(self.poles())
+        # singularities other than poles
+        singularities = set(self.singularities()) - set(self.poles())
+
         # keep only polyedges connected to singularities or along the boundary
         polyedges = [polyedge for key, polyedge in self.polyedges(data=True)
-                     if (self.is_vertex_singular(polyedge[0]) and not self.is_pole(polyedge[0]))
-                     or (self.is_vertex_singular(polyedge[-1]) and not self.is_pole(polyedge[-1]))
+                     if polyedge[0] in singularities or polyedge[-1] in singularities
                      or self.is_edge_on_boundary(polyedge[0], polyedge[1])]
 
-        # get intersections between polyedges for split
-        vertices = [vkey for polyedge in polyedges for vkey in set(polyedge)]
-        split_vertices = [vkey for vkey in self.vertices() if vertices.count(vkey) > 1]
-
-        # split singularity polyedges
-        return [split_polyedge for polyedge in polyedges
-                for split_polyedge in list_split(polyedge, [polyedge.index(vkey) for vkey in split_vertices if vkey in polyedge])]
+        # split singularity polyedges at their intersections
+        return self.split_polyedges(polyedges)
 
     # def add_face(self, vertices, fkey=None, attr_dict=None, **kwattr):
     #     """Add a face to the mesh object. Allow [a, b, c, c] faces.
@@ -2,6 +2,8 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+import compas
+
 from compas.geometry import Polyline
 from compas.geometry import discrete_coons_patch
 from compas.datastructures import meshes_join_and_weld
@@ -12,6 +14,14 @@ from compas.utilities import linspace
 from ..mesh_quad_coarse import CoarseQuadMesh
 from ..mesh_quad_pseudo import PseudoQuadMesh
 
+if not compas.IPY:
+    from numpy import asarray
+    from numpy import concatenate
+    from numpy import cumsum
+    from numpy import interp
+    from numpy import stack
+    from compas_singular.geometry import discrete_coons_patch_numpy
+
 
 __all__ = [	'CoarsePseudoQuadMesh']
 
@@ -30,6 +40,12 @@ class CoarsePseudoQuadMesh(PseudoQuadMesh, CoarseQuadMesh):
             A denser quad mesh.
         edges_to_curves : dict, optional
             A dictionary with edges (u, v) pointing to curve for densification. The curves are lists of XYZ points.
+            Each edge must have a curve in one of its directions.
+
+        Raises
+        ------
+        KeyError
+            If an edge has no curve in either direction.
 
         """
 
@@ -41,29 +57,27 @@ class CoarsePseudoQuadMesh(PseudoQuadMesh, CoarseQuadMesh):
 
         pole_map = [geometric_key(self.vertex_coordinates(pole)) for pole in self.poles()]
 
-        meshes = []
-        for fkey in self.faces():
-            polylines = []
-            for u, v in self.face_halfedges(fkey):
-                d = self.get_strip_density(edge_strip[u, v])
-
+        # points along the coarse edges, sampled once per edge and reversed for the opposite halfedge
+        samples = {}
+
+        def edge_points(u, v, d):
+            if edges_to_curves and (u, v) not in edges_to_curves:
+                if (v, u) not in edges_to_curves:
+                    raise KeyError('No curve for the edge {} in either direction.'.format((u, v)))
+                return edge_points(v, u, d)[::-1]
+            if not edges_to_curves and (v, u) in samples:
+                return samples[v, u][::-1]
+            if (u, v) not in samples:
                 if edges_to_curves:
-                    polyline = []
-                    if (u, v) in edges_to_curves:
-                        curve = Polyline(edges_to_curves[u, v])
-                        polyline = [curve.point(t) for t in linspace(0, 1, d)]
-                    else:
-                        curve = Polyline(edges_to_curves[v, u])
-                        polyline = [curve.point(t) for t in linspace(0, 1, d)]
-                        polyline[:] = polyline[::-1]
+                    samples[u, v] = curve_points(edges_to_curves[u, v], linspace(0, 1, d))
                 else:
-                    polyline = []
                     curve = Polyline([self.vertex_coordinates(u), self.vertex_coordinates(v)])
-                    for i in range(0, d + 1):
-                        point = curve.point(float(i) / float(d))
-                        polyline.append(point)
+                    samples[u, v] = [curve.point(float(i) / float(d)) for i in range(0, d + 1)]
+            return samples[u, v]
 
-                polylines.append(polyline)
+        meshes = []
+        for fkey in self.faces():
+            polylines = [edge_points(u, v, self.get_strip_density(edge_strip[u, v])) for u, v in self.face_halfedges(fkey)]
 
             if self.is_face_pseudo_quad(fkey):
                 pole = self.attributes['face_pole'][fkey]
@@ -82,7 +96,10 @@ class CoarsePseudoQuadMesh(PseudoQuadMesh, CoarseQuadMesh):
             else:
                 ad = None
 
-            vertices, faces = discrete_coons_patch(ab, bc, dc, ad)
+            if compas.IPY:
+                vertices, faces = discrete_coons_patch(ab, bc, dc, ad)
+            else:
+                vertices, faces = [array.tolist() for array in discrete_coons_patch_numpy(ab, bc, dc, ad)]
             faces = [[u for u, v in pairwise(face + face[:1]) if u != v] for face in faces]
             mesh = PseudoQuadMesh.from_vertices_and_faces_with_face_poles(vertices, faces)
             meshes.append(mesh)
@@ -109,6 +126,33 @@ class CoarsePseudoQuadMesh(PseudoQuadMesh, CoarseQuadMesh):
         return self.get_quad_mesh()
 
 
+def curve_points(curve, params):
+    """Points along a polyline curve at normalised arc-length parameters, interpolated in its arc-length table.
+
+    Parameters
+    ----------
+    curve : list
+        The curve as a list of point XYZ-coordinates.
+    params : list
+        The parameters between 0 and 1.
+
+    Returns
+    -------
+    list
+        The point XYZ-coordinates.
+
+    """
+    if compas.IPY:
+        polyline = Polyline(curve)
+        return [polyline.point(t) for t in params]
+
+    points = asarray(curve, dtype=float)
+    lengths = concatenate([[0.], cumsum(((points[1:] - points[:-1]) ** 2).sum(axis=1) ** .5)])
+    table = lengths / lengths[-1]
+    params = asarray(list(params), dtype=float)
+    return stack([interp(params, table, points[:, i]) for i in range(3)], axis=1).tolist()
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
@@ -2,12 +2,15 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
-from compas.datastructures import network_polylines
-from compas.datastructures import trimesh_face_circle
+import compas
+
+from compas.geometry import circle_from_points
 from compas.utilities import geometric_key
 
 from ..mesh import Mesh
-from ..network import Network
+
+if not compas.IPY:
+    from compas_singular.geometry import circumcentres_numpy
 
 
 __all__ = ["Skeleton"]
@@ -28,6 +31,8 @@ class Skeleton(Mesh):
 
     def __init__(self):
         super(Skeleton, self).__init__()
+        self._face_circumcentres = None
+        self._face_circumcentre_geometric_keys = None
 
     @classmethod
     def from_mesh(cls, mesh):
@@ -41,6 +46,86 @@ class Skeleton(Mesh):
         """
         return cls.from_vertices_and_faces(*mesh.to_vertices_and_faces())
 
+    # --------------------------------------------------------------------------
+    # circumcentres
+    # --------------------------------------------------------------------------
+
+    def add_vertex(self, *args, **kwargs):
+        self.clear_face_circumcentres()
+        return super(Skeleton, self).add_vertex(*args, **kwargs)
+
+    def add_face(self, *args, **kwargs):
+        self.clear_face_circumcentres()
+        return super(Skeleton, self).add_face(*args, **kwargs)
+
+    def delete_vertex(self, *args, **kwargs):
+        self.clear_face_circumcentres()
+        return super(Skeleton, self).delete_vertex(*args, **kwargs)
+
+    def delete_face(self, *args, **kwargs):
+        self.clear_face_circumcentres()
+        return super(Skeleton, self).delete_face(*args, **kwargs)
+
+    def clear_face_circumcentres(self):
+        """Clear the cached face circumcentres.
+        Done automatically when vertices or faces are added or deleted, to call after moving vertices.
+
+        """
+        self._face_circumcentres = None
+        self._face_circumcentre_geometric_keys = None
+
+    def face_circumcentres(self):
+        """Get the circumcentres of all the faces in the Delaunay mesh, computed in one pass and cached.
+
+        Returns
+        -------
+        dict
+            A dictionary of face keys pointing to circumcentre XYZ-coordinates.
+
+        """
+        if self._face_circumcentres is None:
+            fkeys = list(self.faces())
+            triangles = [[self.vertex_coordinates(vkey) for vkey in self.face_vertices(fkey)] for fkey in fkeys]
+            if compas.IPY:
+                centres = [circle_from_points(*triangle)[0] for triangle in triangles]
+            else:
+                centres = circumcentres_numpy(triangles).tolist() if len(triangles) > 0 else []
+            self._face_circumcentres = dict(zip(fkeys, centres))
+        return self._face_circumcentres
+
+    def face_circumcentre(self, fkey):
+        """Get the circumcentre of a face in the Delaunay mesh.
+
+        Parameters
+        ----------
+        fkey : hashable
+            A face key.
+
+        Returns
+        -------
+        list
+            The circumcentre XYZ-coordinates.
+
+        """
+        return self.face_circumcentres()[fkey]
+
+    def face_circumcentre_geometric_keys(self):
+        """Get the geometric keys of the face circumcentres in the Delaunay mesh, cached with the circumcentres.
+
+        Returns
+        -------
+        dict
+            A dictionary of face keys pointing to circumcentre geometric keys.
+
+        """
+        if self._face_circumcentre_geometric_keys is None:
+            self._face_circumcentre_geometric_keys = {fkey: geometric_key(xyz) for fkey, xyz in self.face_circumcentres().items()}
+        return self._face_circumcentre_geometric_keys
+
+    # --------------------------------------------------------------------------
+    # topological skeleton
+    # --------------------------------------------------------------------------
+
     def singular_faces(self):
         """Get the indices of the singular faces in the Delaunay mesh, i.e. the ones with three neighbours.
 
@@ -61,9 +146,7 @@ class Skeleton(Mesh):
             List of point XYZ-coordinates.
 
         """
-        return [
-            trimesh_face_circle(self, fkey)[0] for fkey in self.singular_faces()
-        ]
+        return [self.face_circumcentre(fkey) for fkey in self.singular_faces()]
 
     def lines(self):
         """Get the lines forming the topological skeleton, i.e. the lines connecting the circumcentres of adjacent faces.
@@ -74,25 +157,83 @@ class Skeleton(Mesh):
             List of lines as tuples of pairs XYZ-coordinates.
 
         """
+        centres = self.face_circumcentres()
+        geom_keys = self.face_circumcentre_geometric_keys()
         return [
-            (trimesh_face_circle(self, fkey)[0], trimesh_face_circle(self, nbr)[0])
+            (centres[fkey], centres[nbr])
             for fkey in self.faces()
             for nbr in self.face_neighbors(fkey)
             if fkey < nbr
-            and geometric_key(trimesh_face_circle(self, fkey)[0])
-            != geometric_key(trimesh_face_circle(self, nbr)[0])
+            and geom_keys[fkey] != geom_keys[nbr]
         ]
 
+    def face_branches(self):
+        """Get the branches of the topological skeleton as chains of face keys,
+        walking the dual graph of the Delaunay mesh between the faces with one or three neighbours.
+        Branches without such faces are closed, with the same first and last face keys.
+
+        Returns
+        -------
+        list
+            List of branches as lists of face keys.
+
+        """
+        nbrs = {fkey: self.face_neighbors(fkey) for fkey in self.faces()}
+
+        branches = []
+        visited = set()
+
+        def walk(branch):
+            # continue until a face without two neighbours or back to the start
+            while len(nbrs[branch[-1]]) == 2 and branch[-1] != branch[0]:
+                visited.add(branch[-1])
+                u, v = branch[-2:]
+                branch.append(nbrs[v][1] if nbrs[v][0] == u else nbrs[v][0])
+            return branch
+
+        # open branches between faces with one or three neighbours
+        ends = [fkey for fkey, fkey_nbrs in nbrs.items() if len(fkey_nbrs) != 2]
+        end_to_end = set()
+        for fkey in ends:
+            for nbr in nbrs[fkey]:
+                if nbr in visited or (fkey, nbr) in end_to_end:
+                    continue
+                branch = walk([fkey, nbr])
+                # skip the walk back between directly connected extremities
+                if len(branch) == 2:
+                    end_to_end.add((nbr, fkey))
+                branches.append(branch)
+
+        # closed branches
+        for fkey, fkey_nbrs in nbrs.items():
+            if len(fkey_nbrs) == 2 and fkey not in visited:
+                visited.add(fkey)
+                branches.append(walk([fkey, fkey_nbrs[0]]))
+
+        return branches
+
     def branches(self):
         """Get the branch polylines of the topological skeleton as polylines connecting singular points.
+        The coordinates are derived from the face branches, skipping consecutive coincident circumcentres.
 
         Returns
         -------
         list
-            List of polylines as tuples of XYZ-coordinates.
+            List of polylines as lists of XYZ-coordinates.
 
         """
-        return network_polylines(Network.from_lines(self.lines()))
+        centres = self.face_circumcentres()
+        geom_keys = self.face_circumcentre_geometric_keys()
+
+        polylines = []
+        for branch in self.face_branches():
+            polyline = [branch[0]]
+            for fkey in branch[1:]:
+                if geom_keys[fkey] != geom_keys[polyline[-1]]:
+                    polyline.append(fkey)
+            if len(polyline) > 1:
+                polylines.append([centres[fkey] for fkey in polyline])
+        return polylines
 
 
 # ==============================================================================
@@ -48,14 +48,70 @@ Projection functions.
     closest_point_on_polyline
     closest_point_on_polylines
 
+
+Circle
+======
+
+Circle functions.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    circumcentres_numpy
+
+
+Boundary
+========
+
+Boundary analysis functions.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    polygons_turning_angles_numpy
+
+
+Polygon
+=======
+
+Polygon functions.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    is_point_in_polygon_xy_numpy
+
+
+Coons
+=====
+
+Coons patch functions.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    discrete_coons_patch_numpy
+
 """
 
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas
+
 from .array import *  # noqa: F401 F403
 from .polyline import *  # noqa: F401 F403
 from .projection import *  # noqa: F401 F403
 
+if not compas.IPY:
+    from .circle_numpy import *  # noqa: F401 F403
+    from .boundary_numpy import *  # noqa: F401 F403
+    from .polygon_numpy import *  # noqa: F401 F403
+    from .coons_numpy import *  # noqa: F401 F403
+
 __all__ = [name for name in dir() if not name.startswith('_')]
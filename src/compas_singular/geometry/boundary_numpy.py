@@ -0,0 +1,78 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import arange
+from numpy import arccos
+from numpy import asarray
+from numpy import clip
+from numpy import cumsum
+from numpy import errstate
+from numpy import repeat
+from numpy import split
+from numpy import sum
+from numpy.linalg import norm
+
+
+__all__ = [
+    'polygons_turning_angles_numpy'
+]
+
+
+def polygons_turning_angles_numpy(polygons):
+    """Turning angles, relative kinks and curvatures at the vertices of closed polygons, such as mesh boundaries.
+    All the polygons are processed at once in a single array.
+
+    Parameters
+    ----------
+    polygons : list
+        List of closed polygons as lists of point XYZ-coordinates, without repeating the first point at the end.
+
+    Returns
+    -------
+    angles : list
+        Per polygon, an array of the turning angles in rad between the incoming and the outgoing edges at each vertex.
+    kinks : list
+        Per polygon, an array of the turning angles relative to the mean turning angle of the two adjacent vertices.
+    curvatures : list
+        Per polygon, an array of the turning angles divided by the mean length of the two adjacent edges.
+
+    Notes
+    -----
+    Values are NaN at vertices with a zero-length adjacent edge.
+
+    """
+
+    sizes = [len(polygon) for polygon in polygons]
+    if not sizes:
+        return [], [], []
+
+    points = asarray([xyz for polygon in polygons for xyz in polygon], dtype=float).reshape((-1, 3))
+
+    # indices of the previous and next vertices in the same polygon
+    starts = repeat(cumsum([0] + sizes[:-1]), sizes)
+    counts = repeat(sizes, sizes)
+    local = arange(len(points)) - starts
+    previous = starts + (local - 1) % counts
+    following = starts + (local + 1) % counts
+
+    incoming = points - points[previous]
+    outgoing = points[following] - points
+    incoming_lengths = norm(incoming, axis=1)
+    outgoing_lengths = norm(outgoing, axis=1)
+
+    with errstate(divide='ignore', invalid='ignore'):
+        angles = arccos(clip(sum(incoming * outgoing, axis=1) / (incoming_lengths * outgoing_lengths), -1., 1.))
+        curvatures = 2 * angles / (incoming_lengths + outgoing_lengths)
+    kinks = angles - (angles[previous] + angles[following]) / 2
+
+    splits = cumsum(sizes)[:-1]
+    return split(angles, splits), split(kinks, splits), split(curvatures, splits)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
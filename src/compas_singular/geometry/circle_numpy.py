@@ -0,0 +1,62 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import asarray
+from numpy import cross
+from numpy import errstate
+from numpy import sum
+
+
+__all__ = [
+    'circumcentres_numpy'
+]
+
+
+def circumcentres_numpy(triangles):
+    """Circumcentres of triangles.
+    Same formula as the circle from three points, vectorized over all the triangles.
+
+    Parameters
+    ----------
+    triangles : array
+        Triangle vertex coordinates as an array of shape (n, 3, 3).
+
+    Returns
+    -------
+    array
+        The circumcentre coordinates as an array of shape (n, 3).
+        NaN for degenerate triangles.
+
+    References
+    ----------
+    .. [1] Wikipedia. *Circumscribed circle: Barycentric coordinates*.
+           Available at: https://en.wikipedia.org/wiki/Circumscribed_circle.
+
+    """
+
+    triangles = asarray(triangles, dtype=float).reshape((-1, 3, 3))
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+
+    ab = b - a
+    cb = b - c
+    ba = a - b
+    ca = a - c
+    ac = c - a
+    bc = c - b
+
+    with errstate(divide='ignore', invalid='ignore'):
+        d = 2 * sum(cross(ba, cb) ** 2, axis=1)
+        A = sum(cb ** 2, axis=1) * sum(ba * ca, axis=1) / d
+        B = sum(ca ** 2, axis=1) * sum(ab * cb, axis=1) / d
+        C = sum(ba ** 2, axis=1) * sum(ac * bc, axis=1) / d
+
+    return a * A[:, None] + b * B[:, None] + c * C[:, None]
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,69 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import arange
+from numpy import asarray
+from numpy import linspace
+from numpy import stack
+
+
+__all__ = [
+    'discrete_coons_patch_numpy'
+]
+
+
+def discrete_coons_patch_numpy(ab, bc, dc, ad):
+    """Discrete Coons patch from four boundary polylines, with the grid of points filled in one broadcast expression.
+    Same patch and vertex and face ordering as ``compas.geometry.discrete_coons_patch``.
+
+    Parameters
+    ----------
+    ab : list, array
+        Point XYZ-coordinates of the boundary from a to b, None for a degenerate side at a.
+    bc : list, array
+        Point XYZ-coordinates of the boundary from b to c, None for a degenerate side at b.
+    dc : list, array
+        Point XYZ-coordinates of the boundary from d to c, None for a degenerate side at c.
+    ad : list, array
+        Point XYZ-coordinates of the boundary from a to d, None for a degenerate side at d.
+
+    Returns
+    -------
+    vertices : array
+        The vertex coordinates as an array of shape (n * m, 3), the rows of the (n, m, 3) grid one after the other,
+        where n is the number of points of ab and dc and m the number of points of bc and ad.
+    faces : array
+        The face vertex indices as an array of shape ((n - 1) * (m - 1), 4).
+
+    """
+    ab, bc, dc, ad = [asarray(side, dtype=float).reshape((-1, 3)) if side is not None and len(side) else None for side in (ab, bc, dc, ad)]
+    if ab is None:
+        ab = ad[[0] * len(dc)]
+    if bc is None:
+        bc = ab[[-1] * len(ad)]
+    if dc is None:
+        dc = bc[[-1] * len(ab)]
+    if ad is None:
+        ad = dc[[0] * len(bc)]
+
+    n = len(ab)
+    m = len(bc)
+    ki = linspace(0., 1., n)[:, None, None]
+    kj = linspace(0., 1., m)[None, :, None]
+
+    grid = (ab[:, None] * (1 - kj) + dc[:, None] * kj) + (ad[None] * (1 - ki) + bc[None] * ki) - (
+        ab[0] * ((1 - ki) * (1 - kj)) + bc[0] * (ki * (1 - kj)) + dc[-1] * (ki * kj) + ad[-1] * ((1 - ki) * kj))
+
+    i, j = [index.ravel() for index in stack([arange(n - 1)[:, None].repeat(m - 1, axis=1), arange(m - 1)[None].repeat(n - 1, axis=0)])]
+    faces = stack([i * m + j, i * m + j + 1, (i + 1) * m + j + 1, (i + 1) * m + j], axis=1)
+
+    return grid.reshape((-1, 3)), faces
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
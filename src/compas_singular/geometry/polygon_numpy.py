@@ -0,0 +1,97 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import arange
+from numpy import argsort
+from numpy import asarray
+from numpy import clip
+from numpy import cumsum
+from numpy import errstate
+from numpy import floor
+from numpy import maximum
+from numpy import minimum
+from numpy import repeat
+from numpy import roll
+from numpy import searchsorted
+from numpy import sqrt
+from numpy import zeros
+
+
+__all__ = [
+    'is_point_in_polygon_xy_numpy'
+]
+
+
+def is_point_in_polygon_xy_numpy(points, polygon):
+    """Verify for many points if they lie inside a polygon in the XY-plane.
+    Same ray casting test as for a single point, with the polygon edges binned in horizontal bands
+    so that each point is only tested against the edges overlapping its band.
+
+    Parameters
+    ----------
+    points : array
+        Point XY(Z)-coordinates as an array of shape (n, 2) or (n, 3).
+    polygon : list
+        Polygon as a list of XY(Z)-coordinates, without repeating the first point at the end.
+
+    Returns
+    -------
+    array
+        Boolean array of shape (n,), True for the points inside the polygon.
+
+    """
+
+    points = asarray(points, dtype=float)
+    polygon = asarray(polygon, dtype=float)
+    x, y = points[:, 0], points[:, 1]
+    inside = zeros(len(points), dtype=bool)
+
+    # polygon edges from the previous vertex, as in the single point test
+    x1, y1 = roll(polygon[:, 0], 1), roll(polygon[:, 1], 1)
+    x2, y2 = polygon[:, 0], polygon[:, 1]
+    y_min, y_max = minimum(y1, y2), maximum(y1, y2)
+    x_max = maximum(x1, x2)
+
+    # horizontal bands over the polygon height
+    y0 = y_min.min()
+    n = max(1, int(sqrt(len(polygon))))
+    height = (y_max.max() - y0) / n or 1.
+
+    def band(values):
+        return clip(floor((values - y0) / height).astype(int), 0, n - 1)
+
+    # edges per band, sorted by band
+    lo, hi = band(y_min), band(y_max)
+    counts = hi - lo + 1
+    edges = repeat(arange(len(polygon)), counts)
+    edge_bands = repeat(lo, counts) + arange(counts.sum()) - repeat(cumsum(counts) - counts, counts)
+    order = argsort(edge_bands, kind='stable')
+    edges, edge_bands = edges[order], edge_bands[order]
+    bounds = searchsorted(edge_bands, arange(n + 1))
+
+    # points per band, the ones outside the polygon height are outside
+    candidates = ((y > y0) & (y <= y_max.max())).nonzero()[0]
+    point_bands = band(y[candidates])
+
+    for i in range(n):
+        pts = candidates[point_bands == i]
+        eds = edges[bounds[i]: bounds[i + 1]]
+        if len(pts) == 0 or len(eds) == 0:
+            continue
+        px, py = x[pts][:, None], y[pts][:, None]
+        ex1, ey1, ex2, ey2 = x1[eds], y1[eds], x2[eds], y2[eds]
+        with errstate(divide='ignore', invalid='ignore'):
+            xinters = (py - ey1) * (ex2 - ex1) / (ey2 - ey1) + ex1
+        crossings = (py > y_min[eds]) & (py <= y_max[eds]) & (px <= x_max[eds]) & ((ex1 == ex2) | (px <= xinters))
+        inside[pts] = crossings.sum(axis=1) % 2 == 1
+
+    return inside
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
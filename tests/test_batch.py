@@ -0,0 +1,62 @@
+import os
+import json
+import shutil
+
+from compas.geometry import delaunay_from_points_numpy
+
+from compas_singular.algorithms import batch_decomposition
+
+
+HERE = os.path.dirname(__file__)
+FILE = os.path.abspath(os.path.join(HERE, '..', 'examples', 'data', '01_decomposition.json'))
+
+
+def crashing_delaunay(points):
+    if len(points) > 200:
+        os._exit(1)
+    return delaunay_from_points_numpy(points)
+
+
+def inputs(folder):
+    """The example input twice with the same name in two folders, an invalid input and the example input scaled up and densified.
+    """
+    filepaths = []
+    for name in ['a', 'b']:
+        os.makedirs(os.path.join(folder, name))
+        filepaths.append(os.path.join(folder, name, 'input.json'))
+        shutil.copy(FILE, filepaths[-1])
+    filepaths.append(os.path.join(folder, 'invalid.json'))
+    with open(filepaths[-1], 'w') as f:
+        f.write('[]')
+    with open(FILE, 'r') as f:
+        outer_boundary, inner_boundaries, polyline_features, point_features = json.load(f)
+    outer_boundary = [xyz for u, v in zip(outer_boundary, outer_boundary[1:] + outer_boundary[:1]) for xyz in [u, [(a + b) / 2 for a, b in zip(u, v)]]]
+    filepaths.append(os.path.join(folder, 'dense.json'))
+    with open(filepaths[-1], 'w') as f:
+        json.dump([outer_boundary, inner_boundaries, polyline_features, point_features], f)
+    return filepaths
+
+
+def test_batch_matches_sequential(tmp_path):
+    filepaths = inputs(str(tmp_path / 'inputs'))
+    sequential = batch_decomposition(filepaths, str(tmp_path / 'sequential'), delaunay=delaunay_from_points_numpy)
+    batch = batch_decomposition(filepaths, str(tmp_path / 'batch'), processes=2, delaunay=delaunay_from_points_numpy)
+
+    assert [summary['index'] for summary in batch] == [0, 1, 2, 3]
+    assert [summary['success'] for summary in batch] == [True, True, False, True]
+    assert len(set(summary['dense'] for summary in batch)) == 4
+    assert os.path.basename(batch[0]['dense']) == '0_input_dense.json'
+    assert os.path.basename(batch[1]['dense']) == '1_input_dense.json'
+    for summary, other in zip(sequential, batch):
+        assert summary['coarse_faces'] == other['coarse_faces']
+        assert summary['dense_faces'] == other['dense_faces']
+    with open(str(tmp_path / 'batch' / 'summary.jsonl'), 'r') as f:
+        assert sorted(json.loads(line)['index'] for line in f) == [0, 1, 2, 3]
+
+
+def test_batch_with_crashing_process(tmp_path):
+    filepaths = inputs(str(tmp_path / 'inputs'))
+    summaries = batch_decomposition(filepaths, str(tmp_path / 'outputs'), processes=2, delaunay=crashing_delaunay)
+    assert [summary['success'] for summary in summaries] == [True, True, False, False]
+    assert summaries[3]['error'] == 'The process decomposing the input terminated abruptly.'
+    assert 'terminated abruptly' not in summaries[2]['error']
@@ -0,0 +1,46 @@
+import pytest
+
+from compas_singular.datastructures import CoarsePseudoQuadMesh
+from compas_singular.datastructures import CoarseQuadMesh
+from compas_singular.datastructures import QuadMesh
+
+
+def grid_mesh(n=3):
+    vertices = [[i, j, 0] for j in range(n + 1) for i in range(n + 1)]
+    faces = [[i + (n + 1) * j, i + 1 + (n + 1) * j, i + n + 2 + (n + 1) * j, i + n + 1 + (n + 1) * j] for j in range(n) for i in range(n)]
+    return QuadMesh.from_vertices_and_faces(vertices, faces)
+
+
+def test_polygonal_mesh_independent_of_quad_mesh():
+    coarse = CoarseQuadMesh.from_quad_mesh(grid_mesh())
+    quad_mesh = coarse.get_quad_mesh()
+    quad_mesh.vertex_attributes(5, 'xyz', [1.5, 1.5, 1.])
+    polygonal_mesh = coarse.get_polygonal_mesh()
+    assert polygonal_mesh is not quad_mesh
+    assert polygonal_mesh.vertex_coordinates(5) == [1, 1, 0]
+
+
+def coarse_pseudo_quad_mesh():
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+    mesh = CoarsePseudoQuadMesh.from_vertices_and_faces(vertices, [[0, 1, 2, 3]])
+    mesh.collect_strips()
+    mesh.set_strips_density(3)
+    return mesh
+
+
+def edges_to_lines(mesh):
+    return {(u, v): [mesh.vertex_coordinates(u), mesh.vertex_coordinates(v)] for u, v in mesh.edges()}
+
+
+def test_densification_with_curves_in_one_direction():
+    mesh = coarse_pseudo_quad_mesh()
+    mesh.densification(edges_to_curves=edges_to_lines(mesh))
+    assert mesh.get_quad_mesh().number_of_faces() == 4
+
+
+def test_densification_raises_key_error_for_edge_without_curve():
+    mesh = coarse_pseudo_quad_mesh()
+    edges_to_curves = edges_to_lines(mesh)
+    del edges_to_curves[0, 1]
+    with pytest.raises(KeyError):
+        mesh.densification(edges_to_curves=edges_to_curves)
@@ -0,0 +1,53 @@
+import os
+import json
+import subprocess
+import sys
+
+import pytest
+
+import compas
+
+from compas_singular.algorithms import boundary_triangulation
+from compas_singular.algorithms import SkeletonDecomposition
+
+
+HERE = os.path.dirname(__file__)
+FILE = os.path.abspath(os.path.join(HERE, '..', 'examples', 'data', '01_decomposition.json'))
+
+SCRIPT = """
+import json
+from compas_singular.algorithms import boundary_triangulation
+from compas_singular.algorithms import SkeletonDecomposition
+with open({!r}) as f:
+    outer_boundary, inner_boundaries, polyline_features, point_features = json.load(f)
+trimesh = boundary_triangulation(outer_boundary, inner_boundaries, polyline_features, point_features)
+decomposition = SkeletonDecomposition.from_mesh(trimesh)
+polylines = decomposition.decomposition_polylines()
+mesh = decomposition.decomposition_mesh(point_features)
+print(json.dumps([[[round(x, 6) for x in xyz] for xyz in polyline] for polyline in polylines]))
+print(json.dumps([mesh.face_vertices(fkey) for fkey in mesh.faces()]))
+""".format(FILE)
+
+
+def test_decomposition_independent_of_hash_seed():
+    outputs = []
+    for seed in ['0', '1']:
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        outputs.append(subprocess.check_output([sys.executable, '-c', SCRIPT], env=env))
+    assert outputs[0] == outputs[1]
+
+
+def test_boundary_turning_angles_match_python_fallback():
+    with open(FILE, 'r') as f:
+        outer_boundary, inner_boundaries, polyline_features, point_features = json.load(f)
+    trimesh = boundary_triangulation(outer_boundary, inner_boundaries, polyline_features, point_features)
+    decomposition = SkeletonDecomposition.from_mesh(trimesh)
+    arrays = decomposition.boundary_turning_angles()
+    ipy, compas.IPY = compas.IPY, True
+    try:
+        fallback = decomposition.boundary_turning_angles()
+    finally:
+        compas.IPY = ipy
+    for values, expected in zip(arrays, fallback):
+        assert sorted(values) == sorted(expected)
+        assert [values[vkey] for vkey in expected] == pytest.approx([expected[vkey] for vkey in expected], abs=1e-9)
@@ -0,0 +1,39 @@
+from math import sin
+
+import pytest
+
+from compas.geometry import discrete_coons_patch
+
+from compas_singular.geometry import discrete_coons_patch_numpy
+
+
+def curved_sides(n=4, m=6):
+    ab = [[0.1 * sin(i), i / n, 0.2 * i] for i in range(n + 1)]
+    bc = [[j / m, 1. + 0.1 * sin(j), 0.8 + 0.1 * j] for j in range(m + 1)]
+    dc = [[1. + 0.05 * i, i / n, 0.3 * sin(i)] for i in range(n + 1)]
+    ad = [[j / m, -0.1 * sin(j), 0.] for j in range(m + 1)]
+    ab[-1] = bc[0]
+    dc[0] = ad[-1]
+    dc[-1] = bc[-1]
+    return ab, bc, dc, ad
+
+
+def assert_same_patch(ab, bc, dc, ad):
+    vertices, faces = discrete_coons_patch(ab, bc, dc, ad)
+    array_vertices, array_faces = discrete_coons_patch_numpy(ab, bc, dc, ad)
+    assert array_faces.tolist() == faces
+    assert len(array_vertices) == len(vertices)
+    for xyz, expected in zip(array_vertices.tolist(), vertices):
+        assert xyz == pytest.approx(list(expected), abs=1e-9)
+
+
+def test_discrete_coons_patch_numpy_matches_compas():
+    assert_same_patch(*curved_sides())
+
+
+def test_discrete_coons_patch_numpy_matches_compas_with_degenerate_side():
+    ab, bc, dc, ad = curved_sides(n=5, m=5)
+    for side in range(4):
+        sides = [ab, bc, dc, ad]
+        sides[side] = None
+        assert_same_patch(*sides)
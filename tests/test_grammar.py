@@ -0,0 +1,80 @@
+import os
+
+from math import cos
+from math import pi
+from math import sin
+
+import pytest
+
+from compas.utilities import pairwise
+
+from compas_singular.datastructures import CoarseQuadMesh
+from compas_singular.datastructures import QuadMesh
+from compas_singular.datastructures.mesh_quad.grammar_pattern import add_strip
+from compas_singular.datastructures.mesh_quad.grammar_pattern import split_strip
+from compas_singular.datastructures.mesh_quad.grammar_pattern import strip_polyedge_update
+
+
+HERE = os.path.dirname(__file__)
+FILE = os.path.abspath(os.path.join(HERE, '..', 'examples', 'data', 'coarse_quad_mesh_british_museum.json'))
+
+
+def british_museum():
+    mesh = CoarseQuadMesh.from_json(FILE)
+    mesh.collect_strips()
+    return mesh
+
+
+def topology(mesh):
+    degrees = sorted(mesh.vertex_degree(vkey) for vkey in mesh.vertices())
+    strips = sorted(len(mesh.strip_edges(skey)) for skey in mesh.strips())
+    return mesh.number_of_vertices(), mesh.number_of_faces(), degrees, strips
+
+
+@pytest.mark.parametrize('skey', range(9))
+def test_split_strip_matches_add_strip(skey):
+    mesh = british_museum()
+    skeys = split_strip(mesh, skey, 3)
+    expected = british_museum()
+    for i in range(2):
+        add_strip(expected, expected.strip_side_polyedges(skey)[0])
+    assert len(skeys) == 3
+    assert topology(mesh) == topology(expected)
+    assert sorted(len(mesh.strip_edges(new_skey)) for new_skey in skeys) == [len(expected.strip_edges(skey))] * 3
+
+
+def annulus_mesh(m=8, n=3):
+    vertices = [[(1. + j) * cos(2 * pi * i / m), (1. + j) * sin(2 * pi * i / m), 0.] for j in range(n + 1) for i in range(m)]
+    faces = [[i + m * j, (i + 1) % m + m * j, (i + 1) % m + m * (j + 1), i + m * (j + 1)] for j in range(n) for i in range(m)]
+    return QuadMesh.from_vertices_and_faces(vertices, faces)
+
+
+def grid_mesh(n=3):
+    vertices = [[i, j, 0] for j in range(n + 1) for i in range(n + 1)]
+    faces = [[i + (n + 1) * j, i + 1 + (n + 1) * j, i + n + 2 + (n + 1) * j, i + n + 1 + (n + 1) * j] for j in range(n) for i in range(n)]
+    return QuadMesh.from_vertices_and_faces(vertices, faces)
+
+
+def test_strip_polyedge_update_open_polyedges():
+    mesh = grid_mesh()
+    mesh.collect_strips()
+    polyedge = [4, 5, 6, 7]
+    skey, left, right = add_strip(mesh, polyedge)
+    vertex_modifications = {vkey: [left[i], right[i]] for i, vkey in enumerate(polyedge)}
+    assert strip_polyedge_update(mesh, [1, 5, 9, 13], vertex_modifications) == [1, 21, 17, 9, 13]
+    assert strip_polyedge_update(mesh, [0, 4, 8, 12], vertex_modifications) == [0, 20, 16, 8, 12]
+
+
+def test_strip_polyedge_update_closed_polyedge():
+    mesh = annulus_mesh()
+    mesh.collect_strips()
+    loop = mesh.collect_polyedge(8, 9)
+    assert loop[0] == loop[-1] and not any(mesh.is_vertex_on_boundary(vkey) for vkey in loop)
+    polyedge = [0, 8, 16, 24]
+    skey, left, right = add_strip(mesh, polyedge)
+    vertex_modifications = {vkey: [left[i], right[i]] for i, vkey in enumerate(polyedge)}
+    updated = strip_polyedge_update(mesh, loop, vertex_modifications)
+    assert updated[0] == updated[-1]
+    assert len(updated) == len(loop) + 1
+    assert all(v in mesh.vertex_neighbors(u) for u, v in pairwise(updated))
+    assert set(updated) == (set(loop) - set([polyedge[1]])) | set([left[1], right[1]])
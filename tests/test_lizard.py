@@ -0,0 +1,63 @@
+from compas_singular.datastructures import QuadMesh
+from compas_singular.datastructures.lizard import Lizard
+from compas_singular.datastructures.lizard.lizard import lizard_metrics
+
+
+STRINGS = ['attta', 'atttpa', 'atta', 'atpttpppta', 'atttpatta', 'attpptta', 'p', 'atttpatttpa']
+
+
+def grid_lizard():
+    vertices = [[i, j, 0] for j in range(3) for i in range(3)]
+    faces = [[0, 1, 4, 3], [1, 2, 5, 4], [3, 4, 7, 6], [4, 5, 8, 7]]
+    mesh = QuadMesh.from_vertices_and_faces(vertices, faces)
+    mesh.collect_strips()
+    lizard = Lizard(mesh)
+    lizard.initiate()
+    return lizard
+
+
+def faces_or_fail(lizard):
+    if lizard.mesh.number_of_faces() > 7:
+        raise ValueError('Too many faces.')
+    return lizard_metrics(lizard)
+
+
+def test_strings_match_separate_rollouts():
+    lizard = grid_lizard()
+    results = lizard.from_strings_to_rules(STRINGS, func=lizard_metrics)
+    for string, result in zip(STRINGS, results):
+        rollout = grid_lizard()
+        try:
+            rollout.from_string_to_rules(string)
+        except Exception:
+            assert result is None
+        else:
+            assert result == lizard_metrics(rollout)
+    assert lizard.mesh.number_of_faces() == 4
+
+
+def test_batch_matches_sequential_with_failing_evaluation():
+    lizard = grid_lizard()
+    sequential = lizard.from_strings_to_rules(STRINGS, func=faces_or_fail)
+    batch = lizard.from_strings_to_rules(STRINGS, func=faces_or_fail, processes=2)
+    metrics = lizard.from_strings_to_rules(STRINGS, func=lizard_metrics)
+    assert batch == sequential
+    assert sequential[5] is None and metrics[5] is not None
+    assert sequential[:5] == metrics[:5]
+
+
+def test_batch_meshes_match_separate_rollouts():
+    lizard = grid_lizard()
+    sequential = lizard.from_strings_to_rules(STRINGS)
+    batch = lizard.from_strings_to_rules(STRINGS, processes=3)
+    for string, mesh, other in zip(STRINGS, sequential, batch):
+        rollout = grid_lizard()
+        try:
+            rollout.from_string_to_rules(string)
+        except Exception:
+            assert mesh is None and other is None
+            continue
+        faces = {fkey: rollout.mesh.face_vertices(fkey) for fkey in rollout.mesh.faces()}
+        assert {fkey: mesh.face_vertices(fkey) for fkey in mesh.faces()} == faces
+        assert {fkey: other.face_vertices(fkey) for fkey in other.faces()} == faces
+    assert len(set(id(mesh) for mesh in sequential if mesh is not None)) == len([mesh for mesh in sequential if mesh is not None])
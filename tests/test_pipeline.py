@@ -0,0 +1,71 @@
+import os
+import json
+
+from numpy import array
+
+from compas.geometry import delaunay_from_points_numpy
+
+from compas_singular.algorithms.pipeline import DecompositionPipeline
+from compas_singular.algorithms.pipeline import parameter_key
+
+
+HERE = os.path.dirname(__file__)
+FILE = os.path.abspath(os.path.join(HERE, '..', 'examples', 'data', '01_decomposition.json'))
+
+
+def pipeline(cache=None):
+    with open(FILE, 'r') as f:
+        data = json.load(f)
+    pipeline = DecompositionPipeline(*data, cache=cache)
+    pipeline.parameters['delaunay'] = delaunay_from_points_numpy
+    return pipeline
+
+
+def test_stage_cache_after_parameter_change():
+    cache = {}
+    first = pipeline(cache)
+    faces = first.run().number_of_faces()
+    assert len(cache) == 5
+
+    first.parameters['target_length'] = 2.
+    assert first.run().number_of_faces() != faces
+    assert sorted(first.timings) == ['densification', 'strips']
+    assert first.timings['strips'] == 0. and first.timings['densification'] > 0.
+    assert len(cache) == 6
+
+    second = pipeline(cache)
+    assert second.run().number_of_faces() == faces
+    assert second.timings == {'densification': 0.}
+    assert len(cache) == 6
+
+
+def test_stage_cache_after_input_change():
+    cache = {}
+    first = pipeline(cache)
+    first.run('decomposition')
+    second = pipeline(cache)
+    second.data[0] = [[x * 2., y * 2., z] for x, y, z in second.data[0]]
+    second.run('decomposition')
+    assert len(cache) == 6
+    assert second.timings['triangulation'] > 0. and second.timings['decomposition'] > 0.
+
+
+def test_results_are_copies_of_the_cache():
+    first = pipeline()
+    mesh = first.run()
+    faces = mesh.number_of_faces()
+    mesh.delete_face(next(iter(mesh.faces())))
+    coarsemesh = first.run('strips')
+    coarsemesh.attributes['strips'] = {}
+    assert first.run().number_of_faces() == faces
+    assert first.run('strips').attributes['strips'] != {}
+
+
+def test_parameter_keys_of_callables_and_arrays():
+    def scaled(factor):
+        return lambda points: [[factor * x for x in point] for point in points]
+
+    assert parameter_key(scaled(1.)) == parameter_key(scaled(1.))
+    assert parameter_key(scaled(1.)) != parameter_key(scaled(2.))
+    assert parameter_key({'max_length': array(.5), 'points': array([[0., 1.]])}) == [['max_length', .5], ['points', [[0., 1.]]]]
+    json.dumps(parameter_key(delaunay_from_points_numpy))
@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from compas.geometry import centroid_points
+
+from compas_singular.datastructures import CoarseQuadMesh
+from compas_singular.datastructures import QuadMesh
+from compas_singular.datastructures.mesh_quad.grammar.add_strip import add_strip
+from compas_singular.datastructures.mesh_quad.grammar.delete_strip import delete_strip
+
+
+HERE = os.path.dirname(__file__)
+FILE = os.path.abspath(os.path.join(HERE, '..', 'examples', 'data', 'coarse_quad_mesh_british_museum.json'))
+
+
+def british_museum():
+    mesh = CoarseQuadMesh.from_json(FILE)
+    mesh.collect_strips()
+    mesh.collect_polyedges()
+    return mesh
+
+
+@pytest.mark.parametrize('skey', range(9))
+def test_polyedges_after_delete_strip(skey):
+    mesh = british_museum()
+    delete_strip(mesh, skey)
+    assert mesh.check_polyedges()
+
+
+@pytest.mark.parametrize('polyedge', [[18, 17, 16], [2, 1, 0], [12, 4, 0], [7, 15, 19]])
+def test_polyedges_after_add_strip(polyedge):
+    mesh = british_museum()
+    add_strip(mesh, polyedge)
+    assert mesh.check_polyedges()
+
+
+def test_polyedges_after_successive_edits():
+    mesh = british_museum()
+    for polyedge in [[2, 1, 0], [18, 17, 16], [7, 15, 19]]:
+        add_strip(mesh, polyedge)
+        assert mesh.check_polyedges()
+    mesh = british_museum()
+    for skey in [0, 3, 5]:
+        delete_strip(mesh, skey)
+        assert mesh.check_polyedges()
+
+
+def test_check_polyedges_degenerate_mesh():
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+    mesh = QuadMesh.from_vertices_and_faces(vertices, [[0, 1, 2, 3], [3, 2, 1, 0]])
+    with pytest.raises(ValueError):
+        mesh.check_polyedges()
+
+
+def test_polyedge_graph_after_vertex_move():
+    mesh = british_museum()
+    mesh.polyedge_graph()
+    vkey = next(iter(mesh.vertices()))
+    x, y, z = mesh.vertex_coordinates(vkey)
+    mesh.vertex_attributes(vkey, 'xyz', [x + 1., y - 2., z + 3.])
+    vertices, edges = mesh.polyedge_graph()
+    assert sorted(vertices) == sorted(mesh.polyedges())
+    for key, polyedge in mesh.polyedges(data=True):
+        assert vertices[key] == pytest.approx(centroid_points([mesh.vertex_coordinates(vkey) for vkey in polyedge]))
@@ -0,0 +1,83 @@
+import pytest
+
+import compas
+
+from compas.geometry import centroid_points
+
+from compas_singular.datastructures import QuadMesh
+from compas_singular.datastructures.lizard import Lizard
+
+
+def grid_mesh(n=3):
+    vertices = [[i, j, 0] for j in range(n + 1) for i in range(n + 1)]
+    faces = [[i + (n + 1) * j, i + 1 + (n + 1) * j, i + n + 2 + (n + 1) * j, i + n + 1 + (n + 1) * j] for j in range(n) for i in range(n)]
+    return QuadMesh.from_vertices_and_faces(vertices, faces)
+
+
+def test_singularities_with_stale_polyedges():
+    mesh = grid_mesh()
+    mesh.collect_polyedges()
+    mesh = QuadMesh.from_data(mesh.to_data())
+    mesh.delete_vertex(5)
+    assert mesh.singularities() == [0, 1, 2, 3, 4, 8, 10, 12, 15]
+
+
+def test_singularities_with_deleted_neighbors():
+    mesh = grid_mesh(2)
+    mesh.collect_strips()
+    lizard = Lizard(mesh)
+    lizard.initiate()
+    lizard.from_string_to_rules('atpttpppta')
+    assert any(nbr not in mesh.vertex for vkey in mesh.vertices() for nbr in mesh.halfedge[vkey])
+    assert mesh.singularities() == [6, 7, 8, 9, 10, 11, 13, 18]
+
+
+def test_valency_analysis_matches_python_fallback():
+    mesh = grid_mesh()
+    mesh.delete_face(4)
+    frozen = mesh.valency_analysis()
+    ipy, compas.IPY = compas.IPY, True
+    try:
+        fallback = mesh.valency_analysis()
+    finally:
+        compas.IPY = ipy
+    assert [list(values) for values in frozen] == [list(values) for values in fallback]
+
+
+def test_frozen_snapshot_after_vertex_move_and_pole_change():
+    mesh = grid_mesh()
+    mesh.collect_polyedges()
+    frozen = mesh.freeze()
+    assert 5 not in frozen.singularities()
+    mesh.vertex_attributes(5, 'xyz', [1.5, 1.5, 1.])
+    assert mesh.freeze().xyz[frozen.vertex_index[5]].tolist() == [1.5, 1.5, 1.]
+    for key, centroid in zip(mesh.freeze().polyedge_keys, mesh.freeze().polyedge_centroids().tolist()):
+        polyedge = mesh.attributes['polyedges'][key]
+        assert centroid == pytest.approx(centroid_points([mesh.vertex_coordinates(vkey) for vkey in polyedge]))
+    mesh.attributes['face_pole'] = {0: 5}
+    assert 5 in mesh.freeze().singularities()
+    assert 5 in mesh.singularities()
+
+
+def test_strip_graph_after_vertex_move():
+    mesh = grid_mesh()
+    mesh.collect_strips()
+    mesh.strip_graph()
+    mesh.vertex_attributes(5, 'xyz', [1.5, 1.5, 1.])
+    vertices, edges = mesh.strip_graph()
+    for skey in mesh.strips():
+        polyline = mesh.strip_edge_midpoint_polyline(skey)
+        assert vertices[skey] == pytest.approx(centroid_points(polyline))
+    assert len(edges) == mesh.number_of_faces()
+
+
+def test_strip_graph_with_uncollected_strips():
+    mesh = grid_mesh()
+    vertices, edges = mesh.strip_graph()
+    assert vertices == {} and edges == []
+    mesh.collect_strips()
+    mesh.attributes['strips'] = {skey: edges for skey, edges in mesh.strips(data=True) if skey != 0}
+    mesh.unfreeze()
+    graph = mesh.compact_strip_graph()
+    assert 0 < graph.number_of_edges() < mesh.number_of_faces()
+    assert all(0 not in edge for edge in graph.edges())
@@ -0,0 +1,32 @@
+import os
+import json
+
+from compas.geometry import delaunay_from_points_numpy
+
+from compas_singular.algorithms import boundary_resampling_numpy
+from compas_singular.algorithms.resampling_numpy import decomposition_topology
+
+
+HERE = os.path.dirname(__file__)
+FILE = os.path.abspath(os.path.join(HERE, '..', 'examples', 'data', '01_decomposition.json'))
+
+
+def number_of_points(outer_boundary, inner_boundaries, polyline_features, point_features):
+    return sum(len(polyline) for polyline in [outer_boundary] + inner_boundaries + polyline_features)
+
+
+def test_preserve_topology_reduces_points():
+    with open(FILE, 'r') as f:
+        data = json.load(f)
+    resampled = boundary_resampling_numpy(*data, preserve_topology=True, delaunay=delaunay_from_points_numpy)
+    topology = decomposition_topology(*data, delaunay=delaunay_from_points_numpy)
+    assert topology is not None
+    assert decomposition_topology(*resampled, delaunay=delaunay_from_points_numpy) == topology
+    assert number_of_points(*resampled) < number_of_points(*data)
+
+
+def test_preserve_topology_without_decomposition():
+    outer_boundary = [[0., 0., 0.], [1., 0., 0.], [2., 0., 0.], [3., 0., 0.]]
+    assert decomposition_topology(outer_boundary, [], delaunay=delaunay_from_points_numpy) is None
+    resampled = boundary_resampling_numpy(outer_boundary, [], max_length=.5, preserve_topology=True, delaunay=delaunay_from_points_numpy)
+    assert resampled == (outer_boundary, [], [], [])